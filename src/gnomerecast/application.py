@@ -2,7 +2,7 @@ import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
-from gi.repository import Gtk, Adw, Gio, Gdk
+from gi.repository import Gtk, Adw, Gio, Gdk, GLib
 import concurrent.futures # Added for I/O thread pool
 import importlib.resources # Added for package-relative paths
 import pathlib # Added for path manipulation
@@ -14,6 +14,56 @@ from .views.preferences_window import PreferencesWindow
 # Define the base path for data files within the gnomerecast package
 _GNOMERECAST_DATA_ROOT = importlib.resources.files('gnomerecast') / 'data'
 
+class SaveQueue:
+    """
+    Writes transcript files with asynchronous GIO replaces, one write per file at a time.
+
+    Saves requested while a write to the same path is still in flight are coalesced:
+    only the newest data is written once the current write finishes, so a burst of
+    saves costs at most two writes per file. Main loop only.
+    """
+
+    def __init__(self, application: Gio.Application):
+        self._application = application
+        self._in_flight: set[str] = set()
+        self._pending: dict[str, tuple[GLib.Bytes, object]] = {} # path -> (data, callback) queued behind a write
+
+    def enqueue(self, target_path: str, data: GLib.Bytes, callback) -> None:
+        """
+        Schedules data to replace target_path. callback(target_path, error_message)
+        runs on the main loop once the write finishes; error_message is None on success.
+        """
+        if target_path in self._in_flight:
+            # Supersedes any save already waiting for this path.
+            self._pending[target_path] = (data, callback)
+            return
+        self._start(target_path, data, callback)
+
+    def _start(self, target_path: str, data: GLib.Bytes, callback) -> None:
+        self._in_flight.add(target_path)
+        self._application.hold() # Keep the main loop running until the write completes
+        Gio.File.new_for_path(target_path).replace_contents_bytes_async(
+            data, None, False, Gio.FileCreateFlags.REPLACE_DESTINATION, None,
+            self._on_written, (target_path, callback)
+        )
+
+    def _on_written(self, gfile: Gio.File, result: Gio.AsyncResult, user_data) -> None:
+        target_path, callback = user_data
+        error_message = None
+        try:
+            gfile.replace_contents_finish(result)
+        except GLib.Error as e:
+            error_message = e.message
+        self._in_flight.discard(target_path)
+        try:
+            callback(target_path, error_message)
+        finally:
+            queued = self._pending.pop(target_path, None)
+            if queued is not None:
+                self._start(target_path, *queued)
+            self._application.release()
+
+
 class GnomeRecastApplication(Adw.Application):
     """The main application class for GnomeRecast."""
 
@@ -23,6 +73,7 @@ class GnomeRecastApplication(Adw.Application):
         self.dictation_overlay = None
         self.preferences_window = None
         self.io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1) # For I/O operations
+        self.save_queue = SaveQueue(self) # Transcript file writes, coalesced per path
 
         self.style_manager = Adw.StyleManager.get_default()
 
@@ -7,10 +7,29 @@ import json
 from datetime import datetime
 import pathlib
 import logging # Added
-from ..utils.io import atomic_write_json # Added
+from ..utils.io import atomic_write_json, load_json_file # Added
 
 logger = logging.getLogger(__name__) # Added
 
+def seconds_to_ms(seconds: float) -> int:
+    """
+    Converts seconds to whole milliseconds, rounding to the nearest one;
+    truncating would turn e.g. 1.005 (1004.999... ms in binary) into 1004.
+
+    >>> _format_srt_time(seconds_to_ms(1.005))
+    '00:00:01,005'
+    """
+    return round(seconds * 1000)
+
+
+def _format_srt_time(ms: int) -> str:
+    """Formats milliseconds as an SRT timecode, HH:MM:SS,mmm."""
+    seconds, ms = divmod(ms, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02}:{minutes:02}:{seconds:02},{ms:03}"
+
+
 class SegmentItem(GObject.Object):
     """
     Represents a single segment of a transcript.
@@ -37,6 +56,16 @@ class SegmentItem(GObject.Object):
         self.set_property('end', end)
         self.set_property('text', text)
         self.set_property('speaker', speaker)
+        # Millisecond bounds for display, derived once; segments are not retimed after creation.
+        self.start_ms = seconds_to_ms(start)
+        self.end_ms = seconds_to_ms(end)
+        self._srt_times: tuple[str, str] | None = None # Formatted on first SRT export
+
+    def srt_times(self) -> tuple[str, str]:
+        """Returns the (start, end) SRT timecodes, formatting them only once."""
+        if self._srt_times is None:
+            self._srt_times = (_format_srt_time(self.start_ms), _format_srt_time(self.end_ms))
+        return self._srt_times
 
     def __repr__(self):
         return f"<SegmentItem(start={self.start:.2f}, end={self.end:.2f}, text='{self.text[:20]}...')>"
@@ -79,8 +108,7 @@ class TranscriptItem(GObject.Object):
             if not path_obj.is_file():
                 raise FileNotFoundError(f"Transcript JSON file not found: {json_file_path}")
 
-            with path_obj.open('r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_file(path_obj)
 
             # Validate mandatory keys as per docs/refactordevspec.txt §1.1
             # Mandatory keys in JSON: uuid, timestamp, text, segments, language, source_path (media), audio_source_path (media), output_filename (JSON filename)
@@ -196,6 +224,31 @@ class TranscriptItem(GObject.Object):
             raise ValueError(f"An unexpected error occurred while loading {json_file_path}") from e
 
 
+    @classmethod
+    def from_dict(cls, data: dict, json_file_path: str, segments: list | None = None):
+        """
+        Builds a TranscriptItem from a dict produced by to_dict(), without disk I/O
+        or the validation load_from_json performs.
+
+        Args:
+            data: A dict in the to_dict() layout.
+            json_file_path: Path of the JSON file the data is (or will be) stored at.
+            segments: Optional SegmentItems to use as is; if None they are
+                      rebuilt from data['segments'].
+        """
+        if segments is None:
+            segments = [SegmentItem(start=seg['start'], end=seg['end'], text=seg['text'], speaker=seg.get('speaker', ''))
+                        for seg in data.get('segments', [])]
+        return cls(
+            source_path=json_file_path,
+            audio_source_path=data.get('audio_source_path', data.get('source_path')),
+            transcript_text=data['text'],
+            item_uuid=data['uuid'],
+            timestamp_str=data['timestamp'],
+            segments=segments,
+            language=data['language']
+        )
+
     def __init__(self, source_path: str, transcript_text: str,
                  audio_source_path: str | None = "", # Default to empty string as per GObject prop
                  item_uuid: str | None = None,
@@ -218,7 +271,7 @@ class TranscriptItem(GObject.Object):
         """
         super().__init__()
 
-        self.set_property('uuid', item_uuid if item_uuid else str(uuid.uuid4()))
+        self.set_property('uuid', item_uuid if item_uuid else uuid.uuid4().hex)
         self.set_property('source_path', source_path) # Path to this JSON file
         self.set_property('transcript_text', transcript_text)
 
@@ -242,16 +295,24 @@ class TranscriptItem(GObject.Object):
              logger.warning(f"Invalid segment data passed to TranscriptItem constructor for {self.uuid}. Segments cleared.")
              parsed_segments = []
         self.set_property('segments', parsed_segments)
+        # Text exports by format, valid while the segments list is the one they were rendered from.
+        self._render_cache: tuple[list | None, dict[str, bytes]] = (None, {})
+        # to_segment_dicts() result, valid while the segments list is the one it was built from.
+        self._segment_dicts_cache: tuple[list | None, list[dict]] = (None, [])
         self.set_property('audio_source_path', audio_source_path if audio_source_path is not None else "")
         self.set_property('language', language if language is not None else "en")
 
 
-    def to_dict(self) -> dict:
+    def to_dict(self, include_segments: bool = True) -> dict:
         """
         Serializes the TranscriptItem to a dictionary suitable for JSON storage,
         adhering to the spec in docs/refactordevspec.txt §1.1.
         Keys: uuid, timestamp (YYYYMMDD_HHMMSS), text, segments, language,
-              source_path (media), audio_source_path (media), output_filename (JSON filename)
+              source_path (media), output_filename (JSON filename)
+        The media path is written once, as 'source_path'; files that also carry the
+        older duplicate 'audio_source_path' key still load.
+        With include_segments=False the 'segments' key is left out, for writers
+        that stream iter_segment_dicts() themselves.
         """
         # Convert internal timestamp (YYYY-MM-DD HH:MM:SS) to JSON format (YYYYMMDD_HHMMSS)
         try:
@@ -268,37 +329,53 @@ class TranscriptItem(GObject.Object):
                  json_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
-        return {
+        data = {
             'uuid': self.uuid,
             'timestamp': json_timestamp,
             'text': self.transcript_text, # Full transcript text
-            'segments': [ # List of segment objects
-                {
-                    'start': round(seg.start, 3), # float seconds, rounded
-                    'end': round(seg.end, 3),     # float seconds, rounded
-                    'text': seg.text,             # string, trimmed (SegmentItem __init__ should handle trim if needed)
-                    'speaker': seg.speaker        # string, may be empty
-                } for seg in self.segments
-            ],
             'language': self.language, # string
             'source_path': self.audio_source_path, # Path to original media file (as per spec example for this key)
-            'audio_source_path': self.audio_source_path, # Path to original media file (explicitly named)
             'output_filename': self.output_filename # Basename of the JSON file itself (e.g., "YYYYMMDD_HHMMSS_basename.json")
         }
+        if include_segments:
+            data['segments'] = list(self.iter_segment_dicts()) # List of segment objects
+        return data
+
+    def iter_segment_dicts(self):
+        """Yields each segment in its JSON storage form, one at a time."""
+        for seg in self.segments:
+            yield {
+                'start': round(seg.start, 3), # float seconds, rounded
+                'end': round(seg.end, 3),     # float seconds, rounded
+                'text': seg.text,             # string, trimmed (SegmentItem __init__ should handle trim if needed)
+                'speaker': seg.speaker        # string, may be empty
+            }
+
+    def get_rendered(self, fmt: str, renderer) -> bytes:
+        """
+        Returns renderer(self), computing it once per format. Segments are replaced
+        rather than edited in place, so a new segments list invalidates the cache.
+        """
+        segments, rendered = self._render_cache
+        if segments is not self.segments:
+            rendered = {}
+            self._render_cache = (self.segments, rendered)
+        text = rendered.get(fmt)
+        if text is None:
+            text = rendered[fmt] = renderer(self)
+        return text
 
     def to_segment_dicts(self) -> list[dict]:
         """
         Returns the list of segment data as dictionaries.
         New method as per spec §7.
+        The list is built once per segments list and shared; callers must not mutate it.
         """
-        return [
-            {
-                'start': round(seg.start, 3),
-                'end': round(seg.end, 3),
-                'text': seg.text,
-                'speaker': seg.speaker
-            } for seg in self.segments
-        ]
+        segments, segment_dicts = self._segment_dicts_cache
+        if segments is not self.segments:
+            segment_dicts = list(self.iter_segment_dicts())
+            self._segment_dicts_cache = (self.segments, segment_dicts)
+        return segment_dicts
 
     def save(self):
         """
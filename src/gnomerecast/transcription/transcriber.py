@@ -1,3 +1,4 @@
+import logging
 import threading
 import typing as t
 import os
@@ -12,11 +13,13 @@ from gi.repository import GLib, Gio
 
 from ..utils.models import ModelNotAvailableError, ensure_cached # Updated import
 from ..utils.io import atomic_write_json # Added
+from ..models.transcript_item import seconds_to_ms
 
+logger = logging.getLogger(__name__)
 
 
 ProgressCallback = t.Callable[[float, int, int], None]
-SegmentCallback = t.Callable[[dict], None]
+SegmentCallback = t.Callable[[dict], None] # Invoked on the transcription thread
 # CompletionCallback will now also indicate save status and path
 CompletionCallback = t.Callable[[str, t.List[dict], t.Optional[str], t.Optional[str]], None]
 # status, segments, saved_json_path, save_error_message
@@ -217,15 +220,17 @@ class Transcriber:
                             "text": segment.text.strip(),
                             "start": segment.start,
                             "end": segment.end,
-                            "start_ms": int(segment.start * 1000),
-                            "end_ms": int(segment.end * 1000),
+                            "start_ms": seconds_to_ms(segment.start),
+                            "end_ms": seconds_to_ms(segment.end),
                         }
                         current_file_segments.append(segment_dict)
                         current_full_text += segment.text
 
                         if segment_callback:
-                            print(f"Transcriber: Generated segment [{segment_dict['start']:.2f}s->{segment_dict['end']:.2f}s], calling callback.")
-                            GLib.idle_add(segment_callback, segment_dict)
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("Transcriber: Generated segment [%.2fs->%.2fs], calling callback.", segment.start, segment.end)
+                            # Called directly on this worker thread; the receiver batches segments onto the main loop itself.
+                            segment_callback(segment_dict)
 
 
                     if status == "cancelled":
@@ -237,15 +242,15 @@ class Transcriber:
                         final_completed_count = last_segment_index + 1 if last_segment_index >=0 else current_segments_done
                         GLib.idle_add(progress_callback, current_overall_transcription_pct, final_completed_count, -1.0)
 
-                    print(f"Finished processing segments for {file_path}.")
+                    logger.debug("Finished processing segments for %s.", file_path)
 
                     if status == "completed":
-                        unique_id = str(uuid.uuid4())
+                        unique_id = uuid.uuid4().hex
                         timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
                         base_name = os.path.splitext(os.path.basename(file_path))[0]
                         destination_filename = f"{timestamp_str}_{base_name}.json"
                         destination_path = os.path.join(permanent_storage_dir, destination_filename)
-                        print(f"Generated metadata: UUID={unique_id}, Timestamp={timestamp_str}, DestFile={destination_filename}")
+                        logger.debug("Generated metadata: UUID=%s, Timestamp=%s, DestFile=%s", unique_id, timestamp_str, destination_filename)
 
                         # Prepare segments for JSON file storage as per spec (start, end, text, speaker)
                         segments_for_file = []
@@ -265,38 +270,37 @@ class Transcriber:
                             "text": current_full_text.strip(),
                             "segments": segments_for_file,
                             "language": info.language if info else "unknown", # Ensure info is not None
-                            "source_path": file_path,  # Path to the original media file
-                            "audio_source_path": file_path, # Path to the original media file (spec has both)
+                            "source_path": file_path,  # Path to the original media file (readers also accept 'audio_source_path')
                             "output_filename": destination_filename # Basename of the JSON file
                         }
 
                         try:
-                            print(f"Attempting to save final transcript JSON to: {destination_path} using atomic_write_json")
+                            logger.debug("Attempting to save final transcript JSON to: %s using atomic_write_json", destination_path)
                             # This is a blocking call but we are in a worker thread.
                             atomic_write_json(final_json_data, destination_path)
-                            print(f"JSON saved successfully to {destination_path} via atomic_write_json.")
+                            logger.debug("JSON saved successfully to %s via atomic_write_json.", destination_path)
                             saved_json_path = destination_path # Store for completion callback
                             # status remains "completed"
                             all_files_segments.extend(current_file_segments) # Keep using richer segments for callback
                         except Exception as save_err:
-                            print(f"[ERROR] Failed to save transcript JSON to {destination_path} using atomic_write_json: {save_err}")
+                            logger.error("Failed to save transcript JSON to %s using atomic_write_json: %s", destination_path, save_err)
                             status = "completed_save_failed" # Indicate transcription was ok, but save failed
                             save_error_message = str(save_err)
 
 
                 except Exception as transcribe_err:
-                    print(f"[ERROR] faster-whisper transcribe failed for {file_path}: {transcribe_err}")
+                    logger.error("faster-whisper transcribe failed for %s: %s", file_path, transcribe_err)
                     status = "error" # Transcription error itself
                     save_error_message = str(transcribe_err) # Use this field for the primary error
                     break # Stop processing further files on transcription error
 
 
         finally:
-            print(f"Transcription thread finishing with overall status: {status}")
+            logger.debug("Transcription thread finishing with overall status: %s", status)
             # Pass segments if transcription itself completed, regardless of save status for this specific callback argument
             final_segments_to_pass = all_files_segments if (status.startswith("completed") or status == "cancelled") else []
             GLib.idle_add(completion_callback, status, final_segments_to_pass, saved_json_path, save_error_message)
-            print("Completion callback scheduled with save status.")
+            logger.debug("Completion callback scheduled with save status.")
 
 
     def start_transcription(
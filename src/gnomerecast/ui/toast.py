@@ -12,6 +12,7 @@ class ToastPresenter:
     
     _instance = None
     _registry: weakref.WeakKeyDictionary[Adw.ToastOverlay, ReferenceType[Gtk.Window] | None] = weakref.WeakKeyDictionary()
+    _coalesced: dict[tuple[Gtk.Widget, str], tuple[int, dict[str, None]]] = {} # (parent, key) -> (timeout source id, distinct messages)
     
     def __new__(cls):
         if cls._instance is None:
@@ -34,7 +35,45 @@ class ToastPresenter:
     @classmethod
     def show(cls, parent: Gtk.Widget, message: str, timeout: int = 3) -> None:
         """Show a toast message attached to the nearest registered overlay."""
-        
+        cls._schedule_toast(parent, message, (), timeout)
+
+    @classmethod
+    def show_template(cls, parent: Gtk.Widget, template: str, *args, timeout: int = 3) -> None:
+        """
+        Like show(), but template.format(*args) only runs in the idle callback,
+        once an overlay has been found to show the toast on.
+        """
+        cls._schedule_toast(parent, template, args, timeout)
+
+    @classmethod
+    def show_coalesced(cls, parent: Gtk.Widget, key: str, message: str, many_template: str,
+                       delay_ms: int = 300, timeout: int = 3) -> None:
+        """
+        Shows one toast for a burst of calls sharing (parent, key): each call restarts
+        a delay_ms quiet period, and when it ends either the message (if every call
+        passed the same one) or many_template.format(count) is shown, count being the
+        number of distinct messages. Main loop only.
+        """
+        pending = cls._coalesced.get((parent, key))
+        if pending is not None:
+            GLib.source_remove(pending[0])
+            messages = pending[1]
+        else:
+            messages = {}
+        messages[message] = None # Repeats of the same message (e.g. the same file saved twice) count once
+
+        def _flush():
+            del cls._coalesced[(parent, key)]
+            if len(messages) == 1:
+                cls.show(parent, message, timeout)
+            else:
+                cls.show_template(parent, many_template, len(messages), timeout=timeout)
+            return GLib.SOURCE_REMOVE
+
+        cls._coalesced[(parent, key)] = (GLib.timeout_add(delay_ms, _flush), messages)
+
+    @classmethod
+    def _schedule_toast(cls, parent: Gtk.Widget, template: str, args: tuple, timeout: int) -> None:
         if cls._instance is None:
             cls() # Ensure singleton instance is created and _last_toast initialized on instance
             
@@ -59,6 +98,7 @@ class ToastPresenter:
                     except StopIteration:
                         pass # _registry is empty
                 
+            message = template.format(*args) if args else template
             if not overlay:
                 print(f"Toast fallback (no overlay for parent {parent}): {message}")
                 return
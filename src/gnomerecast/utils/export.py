@@ -1,18 +1,15 @@
 import datetime
-from typing import TYPE_CHECKING
+import functools
+import os
+import tempfile
+from typing import TYPE_CHECKING, Iterator
+
+from .io import dump_json_bytes
 
 if TYPE_CHECKING:
     # Ensure this matches the actual SegmentItem class if used, or just TranscriptItem
     from ..models.transcript_item import TranscriptItem, SegmentItem
 
-def _format_timestamp_srt(seconds: float) -> str:
-    """Formats seconds into SRT timestamp HH:MM:SS,ms."""
-    delta = datetime.timedelta(seconds=seconds)
-    hours, remainder = divmod(delta.total_seconds(), 3600)
-    minutes, seconds = divmod(remainder, 60)
-    milliseconds = int((seconds - int(seconds)) * 1000)
-    return f"{int(hours):02}:{int(minutes):02}:{int(seconds):02},{milliseconds:03}"
-
 def _format_timestamp_md(seconds: float) -> str:
     """Formats seconds into MD timestamp HH:MM:SS."""
     delta = datetime.timedelta(seconds=seconds)
@@ -20,41 +17,106 @@ def _format_timestamp_md(seconds: float) -> str:
     minutes, seconds = divmod(remainder, 60)
     return f"{int(hours):02}:{int(minutes):02}:{int(seconds):02}"
 
-def export_to_txt(transcript_item: 'TranscriptItem') -> str:
-    """Exports the transcript item to plain text with double newlines between segments."""
+def iter_txt(transcript_item: 'TranscriptItem') -> Iterator[str]:
+    """Yields the plain text export piece by piece: segments separated by double newlines."""
     if not transcript_item or not transcript_item.segments:
-        return ""
+        return
 
+    separator = ""
     # Assuming transcript_item.segments is a list of SegmentItem objects
-    return "\n\n".join(segment.text.strip() for segment in transcript_item.segments if hasattr(segment, 'text') and segment.text)
+    for segment in transcript_item.segments:
+        if hasattr(segment, 'text') and segment.text:
+            yield separator + segment.text.strip()
+            separator = "\n\n"
 
-def export_to_md(transcript_item: 'TranscriptItem') -> str:
-    """Exports the transcript item to Markdown format."""
+def iter_md(transcript_item: 'TranscriptItem') -> Iterator[str]:
+    """Yields the Markdown export piece by piece, one timestamped paragraph per segment."""
     if not transcript_item.segments:
-        return ""
+        return
 
-    md_content = []
+    separator = ""
     for segment in transcript_item.segments:
         start_time_str = _format_timestamp_md(segment.start)
         segment_text = segment.text.strip() if segment.text else ""
-        md_content.append(f"**[{start_time_str}]** {segment_text}")
-
-    return "\n\n".join(md_content)
+        yield f"{separator}**[{start_time_str}]** {segment_text}"
+        separator = "\n\n"
 
-def export_to_srt(transcript_item: 'TranscriptItem') -> str:
-    """Exports the transcript item to SRT format."""
+def iter_srt(transcript_item: 'TranscriptItem') -> Iterator[str]:
+    """Yields the SRT export piece by piece, one numbered cue per segment."""
     if not transcript_item.segments:
-        return ""
+        return
 
-    srt_content = []
+    separator = ""
     for i, segment in enumerate(transcript_item.segments):
-        start_time_str = _format_timestamp_srt(segment.start)
-        end_time_str = _format_timestamp_srt(segment.end)
+        start_time_str, end_time_str = segment.srt_times() # Cached on the segment across exports
         segment_text = segment.text.strip() if segment.text else ""
+        yield f"{separator}{i + 1}\n{start_time_str} --> {end_time_str}\n{segment_text}\n"
+        separator = "\n"
+
+def export_to_txt(transcript_item: 'TranscriptItem') -> str:
+    """Exports the transcript item to plain text with double newlines between segments."""
+    return "".join(iter_txt(transcript_item))
+
+def export_to_md(transcript_item: 'TranscriptItem') -> str:
+    """Exports the transcript item to Markdown format."""
+    return "".join(iter_md(transcript_item))
+
+def export_to_srt(transcript_item: 'TranscriptItem') -> str:
+    """Exports the transcript item to SRT format."""
+    return "".join(iter_srt(transcript_item))
+
+_ITERATORS = {"txt": iter_txt, "md": iter_md, "srt": iter_srt}
+
+def _encode_export(transcript_item: 'TranscriptItem', export_format: str) -> bytes:
+    # Encoded piece by piece, so the whole export never exists as one str as well;
+    # join() sizes the result once instead of growing and then copying a buffer.
+    return b"".join(piece.encode('utf-8') for piece in _ITERATORS[export_format](transcript_item))
 
-        srt_content.append(str(i + 1))
-        srt_content.append(f"{start_time_str} --> {end_time_str}")
-        srt_content.append(segment_text)
-        srt_content.append("")
+def render(transcript_item: 'TranscriptItem', export_format: str) -> bytes:
+    """
+    Renders the transcript item as UTF-8 'txt', 'md' or 'srt', reusing the result
+    of an earlier export of the same item to that format.
+    """
+    return transcript_item.get_rendered(export_format, functools.partial(_encode_export, export_format=export_format))
 
-    return "\n".join(srt_content)
\ No newline at end of file
+def stream_export_json(transcript_item: 'TranscriptItem', target_path: str, buf_size: int = 1 << 20) -> None:
+    """
+    Writes the transcript item as spec-compliant JSON (the TranscriptItem.to_dict()
+    keys) straight to target_path, one segment at a time, so the full segment list
+    is never built in memory. Each value is encoded with utils.io.dump_json_bytes
+    and re-indented to its nesting level, so the file is byte-for-byte what saving
+    the same transcript writes. Like atomic_write_json, it writes a temporary file
+    in the same directory and os.replace()s it into place.
+    """
+    target_dir = os.path.dirname(target_path) or "."
+    with tempfile.NamedTemporaryFile(
+        mode='wb',
+        dir=target_dir,
+        prefix=os.path.basename(target_path) + '.',
+        suffix='.tmp',
+        delete=False,
+        buffering=buf_size
+    ) as tmp_file:
+        temp_file_path = tmp_file.name
+        try:
+            # JSON strings never contain a raw newline, so indenting every line
+            # break nests an encoded value without touching its content.
+            separator = b"{\n  "
+            for key, value in transcript_item.to_dict(include_segments=False).items():
+                tmp_file.write(separator + dump_json_bytes(key) + b": " + dump_json_bytes(value).replace(b"\n", b"\n  "))
+                separator = b",\n  "
+            tmp_file.write(separator + b'"segments": [')
+            separator = b"\n    "
+            for segment_dict in transcript_item.iter_segment_dicts():
+                tmp_file.write(separator)
+                tmp_file.write(dump_json_bytes(segment_dict).replace(b"\n", b"\n    "))
+                separator = b",\n    "
+            # An empty list stays "[]", as dump_json_bytes writes it.
+            tmp_file.write(b"]\n}" if separator == b"\n    " else b"\n  ]\n}")
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        except BaseException:
+            tmp_file.close()
+            os.remove(temp_file_path)
+            raise
+    os.replace(temp_file_path, target_path)
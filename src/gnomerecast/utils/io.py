@@ -3,10 +3,67 @@ import logging
 import os
 import tempfile
 from pathlib import Path
+from typing import Any
+
+# orjson is optional; it serializes and parses large segment lists several times faster.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None # type: ignore
+    ORJSON_AVAILABLE = False
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
+def load_json_file(file_path) -> Any:
+    """
+    Reads and parses a JSON file, with orjson when it is installed.
+
+    Raises:
+        OSError: If the file cannot be read.
+        json.JSONDecodeError: If the content is not valid JSON
+            (orjson.JSONDecodeError is a subclass of it).
+    """
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """
+    Serializes data to UTF-8 JSON bytes in the transcript file layout, with orjson
+    when it is installed.
+
+    Raises:
+        TypeError: If the data is not JSON serializable.
+        ValueError: If JSON encoding fails for other reasons.
+    """
+    # Both paths produce the same layout (2-space indent, non-ASCII kept as is,
+    # which orjson always does), so files don't depend on orjson being installed.
+    # orjson encode errors are TypeErrors.
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _fsync_dir(dir_path: Path) -> None:
+    """Flushes a directory entry change (e.g. a rename) to disk, where the platform allows it."""
+    try:
+        dir_fd = os.open(dir_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        # Some filesystems do not support fsync on directories; the data itself is already synced.
+        pass
+    finally:
+        os.close(dir_fd)
+
+
 def atomic_write_json(data: dict, file_path_str: str) -> None:
     """
     Atomically writes a dictionary to a JSON file.
@@ -29,25 +86,30 @@ def atomic_write_json(data: dict, file_path_str: str) -> None:
         # Ensure the parent directory exists
         path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-        # Use NamedTemporaryFile in the same directory as the target file
+        # Serialize before creating the temporary file.
+        payload = dump_json_bytes(data)
+
+        # Create the temporary file in the same directory as the target file
         # to ensure os.replace works (it might fail across different filesystems).
-        # delete=False is crucial as we handle the deletion/renaming manually.
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            encoding='utf-8',
+        fd, temp_file_path = tempfile.mkstemp(
             dir=path_obj.parent,
             prefix=path_obj.name + '.',
-            suffix='.tmp',
-            delete=False
-        ) as tmp_file:
-            temp_file_path = tmp_file.name
-            json.dump(data, tmp_file, indent=4, ensure_ascii=False)
+            suffix='.tmp'
+        )
+        try:
+            # Write the whole payload straight to the descriptor, bypassing Python's
+            # buffering; os.write may write less than asked, so loop until done.
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
             # Ensure data is written to disk before renaming
-            tmp_file.flush()
-            os.fsync(tmp_file.fileno())
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
         # Atomically replace the target file with the temporary file
         os.replace(temp_file_path, path_obj)
+        _fsync_dir(path_obj.parent)
         logger.info(f"Successfully wrote JSON data to {path_obj}")
 
     except (OSError, IOError) as e:
@@ -0,0 +1,124 @@
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from gi.repository import GLib
+
+from .io import atomic_write_json, load_json_file
+
+logger = logging.getLogger(__name__)
+
+_INDEX_VERSION = 1
+
+_lock = threading.Lock()
+# transcripts dir -> (dir mtime_ns, {filename: (uuid, file mtime_ns)}, {uuid: filename});
+# in-memory mirror of the on-disk index.
+_cache: Dict[str, Tuple[int, Dict[str, Tuple[str, int]], Dict[str, str]]] = {}
+
+
+def _index_path() -> Path:
+    # Kept in the cache dir rather than next to the transcripts: it is derived data,
+    # and writing it must not bump the transcripts directory mtime used to detect changes.
+    return Path(GLib.get_user_cache_dir()) / 'GnomeRecast' / 'uuid-index.json'
+
+
+def _load(transcripts_dir: str) -> Tuple[int, Dict[str, Tuple[str, int]], Dict[str, str]]:
+    cached = _cache.get(transcripts_dir)
+    if cached is not None:
+        return cached
+    files: Dict[str, Tuple[str, int]] = {}
+    dir_mtime_ns = -1
+    try:
+        data = load_json_file(_index_path())
+        if data.get('version') == _INDEX_VERSION and data.get('dir') == transcripts_dir:
+            files = {name: (entry[0], entry[1]) for name, entry in data['files'].items()}
+            dir_mtime_ns = data['dir_mtime_ns']
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError, TypeError, IndexError, AttributeError) as e:
+        # Any malformed index (including valid JSON that is not an object) is rebuilt.
+        logger.warning(f"Ignoring unreadable UUID index {_index_path()}: {e}")
+        files = {}
+        dir_mtime_ns = -1
+    loaded = (dir_mtime_ns, files, {item_uuid: name for name, (item_uuid, _) in files.items() if item_uuid})
+    _cache[transcripts_dir] = loaded
+    return loaded
+
+
+def _save(transcripts_dir: str) -> None:
+    dir_mtime_ns, files, _ = _cache[transcripts_dir]
+    data = {
+        'version': _INDEX_VERSION,
+        'dir': transcripts_dir,
+        'dir_mtime_ns': dir_mtime_ns,
+        'files': {name: [item_uuid, mtime_ns] for name, (item_uuid, mtime_ns) in files.items()},
+    }
+    try:
+        atomic_write_json(data, str(_index_path()))
+    except Exception as e:
+        # The index is only a cache; the next refresh rebuilds what is missing.
+        logger.warning(f"Could not write UUID index {_index_path()}: {e}")
+
+
+def _read_uuid(json_file_path: str) -> str:
+    """Returns the transcript's uuid, or "" if the file is not a readable transcript."""
+    try:
+        item_uuid = load_json_file(json_file_path).get('uuid')
+    except (OSError, ValueError, AttributeError):
+        return ""
+    return item_uuid if isinstance(item_uuid, str) else ""
+
+
+def _refresh(transcripts_dir: str) -> Dict[str, str]:
+    """Brings the index up to date and returns its uuid -> filename map."""
+    dir_mtime_ns = os.stat(transcripts_dir).st_mtime_ns
+    stored_mtime_ns, files, by_uuid = _load(transcripts_dir)
+    if stored_mtime_ns == dir_mtime_ns:
+        # Transcripts are only ever written via atomic replace, which bumps the directory mtime.
+        return by_uuid
+
+    fresh: Dict[str, Tuple[str, int]] = {}
+    with os.scandir(transcripts_dir) as entries:
+        for entry in entries:
+            if not entry.name.lower().endswith(".json") or not entry.is_file():
+                continue
+            mtime_ns = entry.stat().st_mtime_ns
+            known = files.get(entry.name)
+            if known is not None and known[1] == mtime_ns:
+                fresh[entry.name] = known
+            else:
+                # Only new or rewritten files are parsed.
+                fresh[entry.name] = (_read_uuid(entry.path), mtime_ns)
+
+    by_uuid = {item_uuid: name for name, (item_uuid, _) in fresh.items() if item_uuid}
+    _cache[transcripts_dir] = (dir_mtime_ns, fresh, by_uuid)
+    _save(transcripts_dir)
+    return by_uuid
+
+
+def find_transcript_by_uuid(transcripts_dir: str, item_uuid: str) -> Optional[str]:
+    """
+    Returns the path of the transcript in transcripts_dir whose uuid is item_uuid,
+    or None. Unchanged transcripts are never re-parsed.
+    """
+    with _lock:
+        filename = _refresh(transcripts_dir).get(item_uuid)
+    return os.path.join(transcripts_dir, filename) if filename else None
+
+
+def record_transcript(json_file_path: str, item_uuid: str) -> None:
+    """Adds a transcript just written into its directory to the index."""
+    transcripts_dir = os.path.dirname(json_file_path)
+    filename = os.path.basename(json_file_path)
+    with _lock:
+        dir_mtime_ns, files, by_uuid = _load(transcripts_dir)
+        previous = files.get(filename)
+        if previous is not None and by_uuid.get(previous[0]) == filename:
+            del by_uuid[previous[0]]
+        files[filename] = (item_uuid, os.stat(json_file_path).st_mtime_ns)
+        by_uuid[item_uuid] = filename
+        # The stored directory mtime is left as is, so the next lookup still
+        # rescans for files other writers (e.g. the transcriber) added meanwhile.
+        _save(transcripts_dir)
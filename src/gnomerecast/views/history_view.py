@@ -42,6 +42,7 @@ class HistoryView(Gtk.Box):
         self.app = application # Store the application instance
         self.add_css_class("history-view-box")
         self._on_transcript_selected_callback = on_transcript_selected
+        self._rows_by_path: dict[str, Gtk.ListBoxRow] = {} # Transcript JSON path -> its row, for update_item
 
         TRANSCRIPT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -134,6 +135,7 @@ class HistoryView(Gtk.Box):
         # Clear again just in case something was added between initial clear and this idle_add
         while row := self.list_box.get_row_at_index(0):
             self.list_box.remove(row)
+        self._rows_by_path.clear()
 
         if not items:
             if not TRANSCRIPT_DIR.exists() or not any(f.is_file() and f.suffix == ".json" for f in TRANSCRIPT_DIR.iterdir() if f.exists()): # Re-check if dir is truly empty
@@ -146,41 +148,82 @@ class HistoryView(Gtk.Box):
             return
 
         for item in items:
-            row = Gtk.ListBoxRow()
+            self.list_box.append(self._build_row(item))
+
+    def _build_row(self, item: TranscriptItem) -> Gtk.ListBoxRow:
+        """Creates the list row for a transcript item and registers it by path."""
+        row = Gtk.ListBoxRow()
+
+        gesture = Gtk.GestureClick.new()
+        gesture.set_button(0)
+        gesture.connect("released", self._on_row_clicked)
+        row.add_controller(gesture)
+
+        row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        row_box.set_margin_top(6)
+        row_box.set_margin_bottom(6)
+        row_box.set_margin_start(12)
+        row_box.set_margin_end(12)
+
+        filename_label = Gtk.Label()
+        filename_label.set_halign(Gtk.Align.START)
+        filename_label.set_hexpand(True)
+
+        timestamp_label = Gtk.Label()
+        timestamp_label.set_halign(Gtk.Align.END)
+        timestamp_label.set_css_classes(["dim-label"])
+
+        row_box.append(filename_label)
+        row_box.append(timestamp_label)
+        row.set_child(row_box)
+
+        setattr(row, "_filename_label", filename_label)
+        setattr(row, "_timestamp_label", timestamp_label)
+        self._set_row_item(row, item)
+        return row
+
+    def _set_row_item(self, row: Gtk.ListBoxRow, item: TranscriptItem):
+        """Points a row at item and refreshes its labels."""
+        setattr(row, "_transcript_item", item)
+        if item.source_path:
+            self._rows_by_path[item.source_path] = row
 
-            setattr(row, "_transcript_item", item)
-
-            gesture = Gtk.GestureClick.new()
-            gesture.set_button(0)
-            gesture.connect("released", self._on_row_clicked)
-            row.add_controller(gesture)
-
-            row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-            row_box.set_margin_top(6)
-            row_box.set_margin_bottom(6)
-            row_box.set_margin_start(12)
-            row_box.set_margin_end(12)
-
-            filename_label = Gtk.Label(label=item.output_filename or "Untitled Transcript")
-            filename_label.set_halign(Gtk.Align.START)
-            filename_label.set_hexpand(True)
-
-            try:
-                dt_object = datetime.fromisoformat(item.timestamp)
-                timestamp_str = dt_object.strftime("%Y-%m-%d %H:%M:%S")
-            except (ValueError, TypeError):
-                timestamp_str = item.timestamp
+        try:
+            dt_object = datetime.fromisoformat(item.timestamp)
+            timestamp_str = dt_object.strftime("%Y-%m-%d %H:%M:%S")
+        except (ValueError, TypeError):
+            timestamp_str = item.timestamp
 
-            timestamp_label = Gtk.Label(label=timestamp_str)
-            timestamp_label.set_halign(Gtk.Align.END)
-            timestamp_label.set_css_classes(["dim-label"])
+        getattr(row, "_filename_label").set_label(item.output_filename or "Untitled Transcript")
+        getattr(row, "_timestamp_label").set_label(timestamp_str)
 
-            row_box.append(filename_label)
-            row_box.append(timestamp_label)
+    def update_item(self, json_file_path: str, item: TranscriptItem):
+        """
+        Shows a transcript that was just saved to json_file_path without rescanning
+        the directory: its row is updated in place, or a new row is inserted in
+        timestamp order. Files outside TRANSCRIPT_DIR are not listed and are ignored.
+        """
+        if os.path.dirname(json_file_path) != str(TRANSCRIPT_DIR):
+            return
 
-            row.set_child(row_box)
-            self.list_box.append(row)
+        row = self._rows_by_path.get(json_file_path)
+        if row is not None and row.get_parent() is self.list_box:
+            self._set_row_item(row, item)
+            return
 
+        # Drop the "no transcripts"/loading placeholder, the only rows without an item.
+        first = self.list_box.get_row_at_index(0)
+        if first is not None and getattr(first, "_transcript_item", None) is None:
+            self.list_box.remove(first)
+
+        # Rows are kept newest first; a fresh save normally lands at index 0.
+        index = 0
+        while (other := self.list_box.get_row_at_index(index)) is not None:
+            other_item = getattr(other, "_transcript_item", None)
+            if other_item is not None and other_item.timestamp <= item.timestamp:
+                break
+            index += 1
+        self.list_box.insert(self._build_row(item), index)
 
     def _on_row_clicked(self, gesture: Gtk.GestureClick, n_press: int, x: float, y: float):
         """
@@ -1,14 +1,59 @@
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, Gdk, GLib, Pango, GObject
+from gi.repository import Gtk, Adw, Gdk, GLib, Gio, Pango, GObject
 
+import bisect
+import functools
+import itertools
 import logging
-from typing import Dict, Any, Optional # Added Optional
-from ..models.transcript_item import TranscriptItem # Added
+import threading
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union # Added Optional
+from ..models.transcript_item import TranscriptItem, seconds_to_ms # Added
 
 log = logging.getLogger(__name__)
 
+# Windowed rendering: only segments near the viewport get real row widgets.
+_ROW_HEIGHT_ESTIMATE = 96 # px, stands in for row heights until some rows have been measured
+_WINDOW_MARGIN_ROWS = 10 # rows realized above and below the viewport
+
+class SegmentData:
+    """
+    Display-side record for one transcript segment.
+    Slotted, so a thousand-segment transcript costs far less than the same data in dicts.
+    """
+    __slots__ = ('text', 'start', 'end', 'speaker', 'start_ms', 'end_ms')
+
+    def __init__(self, text: str, start: float, end: float, speaker: str = '',
+                 start_ms: Optional[int] = None, end_ms: Optional[int] = None):
+        self.text = text
+        self.start = start # seconds
+        self.end = end
+        self.speaker = speaker
+        self.start_ms = seconds_to_ms(start) if start_ms is None else start_ms
+        self.end_ms = seconds_to_ms(end) if end_ms is None else end_ms
+
+    @classmethod
+    def from_dict(cls, segment_dict: Dict[str, Any]) -> "SegmentData":
+        """Converts a transcriber segment dict. Raises KeyError if text/start/end are missing."""
+        return cls(segment_dict['text'], segment_dict['start'], segment_dict['end'],
+                   segment_dict.get('speaker', ''), segment_dict.get('start_ms'), segment_dict.get('end_ms'))
+
+
+def build_segment_data(segments) -> List[SegmentData]:
+    """
+    Converts SegmentItem objects to the records add_segment(s) expects.
+    Only reads plain attributes, so it is safe to call off the main thread.
+    """
+    # The single-element inner loop binds each GObject property to a local, so
+    # every attribute is read exactly once per segment.
+    return [
+        SegmentData(text, start, end, speaker, seg_item_obj.start_ms, seg_item_obj.end_ms)
+        for seg_item_obj in segments
+        for text, start, end, speaker in ((seg_item_obj.text, seg_item_obj.start, seg_item_obj.end, seg_item_obj.speaker),)
+    ]
+
+
 class TranscriptionView(Gtk.Box):
     """
     Live transcription view displaying progress, segments, and controls.
@@ -31,17 +76,25 @@ class TranscriptionView(Gtk.Box):
         self.toolbar_view.set_vexpand(True)
         self.append(self.toolbar_view)
 
-        self._segments_data = [] # Holds dicts for UI display
+        self._segments_data: List[SegmentData] = [] # Source of truth for UI display
+        self._segment_markup: List[str] = [] # Parallel to _segments_data, pre-escaped row markup
+        self._segment_rows: Dict[int, Gtk.ListBoxRow] = {} # segment index -> realized row
+        self._realized_range: Tuple[int, int] = (0, 0) # [lo, hi) of realized segment indices
+        self._row_heights: List[int] = [] # Parallel to _segments_data, measured row height in px (0 = never realized)
+        self._row_offsets: Optional[List[int]] = None # Prefix sums of row heights, rebuilt lazily
+        self._range_update_source: int = 0 # Pending idle from the adjustment's "changed" signal
         self.current_item: Optional[TranscriptItem] = None # Holds the loaded TranscriptItem, if any
+        self._saved_timestamp_cache: Optional[Tuple[str, str]] = None # (item timestamp, JSON timestamp)
 
         self._build_ui()
 
-    def _format_timestamp(self, ms: int) -> str:
-        """Formats milliseconds into mm:ss,SSS"""
-        minutes = ms // 60000
-        seconds = (ms % 60000) // 1000
-        milliseconds = ms % 1000
-        return f"{minutes}:{seconds:02d},{milliseconds:03d}"
+    def _format_time_range(self, start_ms: int, end_ms: int) -> str:
+        """Formats a start/end pair in milliseconds as "m:ss,SSS → m:ss,SSS"."""
+        # Plain integer math and one %-format; no divmod tuples or per-field f-string conversions.
+        return "%d:%02d,%03d → %d:%02d,%03d" % (
+            start_ms // 60000, start_ms // 1000 % 60, start_ms % 1000,
+            end_ms // 60000, end_ms // 1000 % 60, end_ms % 1000,
+        )
 
     def _build_ui(self):
         header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
@@ -83,32 +136,80 @@ class TranscriptionView(Gtk.Box):
         )
         main_box.append(self.scrolled_window)
 
+        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        self._top_spacer = Gtk.Box()
+        content_box.append(self._top_spacer)
+
         self.list_box = Gtk.ListBox(
             selection_mode=Gtk.SelectionMode.NONE,
             vexpand=True,
             css_classes=["transcript-list"],
         )
-        self.scrolled_window.set_child(self.list_box)
+        content_box.append(self.list_box)
+
+        self._bottom_spacer = Gtk.Box()
+        content_box.append(self._bottom_spacer)
+        self.scrolled_window.set_child(content_box)
+
+        vadjustment = self.scrolled_window.get_vadjustment()
+        vadjustment.connect("value-changed", self._on_scroll)
+        vadjustment.connect("changed", self._on_adjustment_changed)
+
+        # Row buttons target these actions with the segment index instead of
+        # capturing the row and its text in per-button closures.
+        action_group = Gio.SimpleActionGroup()
+        remove_action = Gio.SimpleAction.new("remove-segment", GLib.VariantType.new("i"))
+        remove_action.connect("activate", self._on_remove_segment_activate)
+        action_group.add_action(remove_action)
+        copy_action = Gio.SimpleAction.new("copy-segment", GLib.VariantType.new("i"))
+        copy_action.connect("activate", self._on_copy_segment_activate)
+        action_group.add_action(copy_action)
+        self.insert_action_group("segments", action_group)
+
+        self._clipboard: Optional[Gdk.Clipboard] = None
+        display = Gdk.Display.get_default()
+        if display:
+            self._clipboard = display.get_clipboard()
+            display.connect("closed", self._on_display_closed)
 
     def _on_stop_clicked(self, button):
         log.info("Stop button clicked")
         self.emit("stop-transcription")
 
-    def _on_remove_segment_clicked(self, button, row, segment_index):
+    def _on_remove_segment_activate(self, action, param):
+        segment_index = param.get_int32()
         log.info(f"Remove button clicked for segment index: {segment_index}")
-        self.list_box.remove(row)
+        if not 0 <= segment_index < len(self._segments_data):
+            log.warning(f"Remove requested for unknown segment index: {segment_index}")
+            return
+        # _segments_data is the source of truth for the windowed renderer, so the
+        # segment is dropped there; realized rows are rebuilt with shifted targets.
+        del self._segments_data[segment_index]
+        del self._segment_markup[segment_index]
+        del self._row_heights[segment_index]
+        self._row_offsets = None
+        self._clear_realized_rows()
+        self._update_realized_range(force=True)
         self.emit("segment-removed", segment_index)
 
-    def _on_copy_segment_clicked(self, button, segment_text):
+    def _on_copy_segment_activate(self, action, param):
+        segment_index = param.get_int32()
+        if not 0 <= segment_index < len(self._segments_data):
+            log.warning(f"Copy requested for unknown segment index: {segment_index}")
+            return
+        segment_text = self._segments_data[segment_index].text.strip()
         log.info(f"Copy button clicked for segment: '{segment_text[:50]}...'")
-        clipboard = Gdk.Display.get_default().get_clipboard()
-        if clipboard:
-            clipboard.set(segment_text)
+        if self._clipboard:
+            self._clipboard.set(segment_text)
             log.info("Segment text copied to clipboard.")
 
         else:
             log.warning("Could not get the default clipboard from Gdk.Display.")
 
+    def _on_display_closed(self, display, is_error):
+        log.info("Default display closed; dropping cached clipboard.")
+        self._clipboard = None
+
     def _scroll_to_bottom(self):
         GLib.idle_add(self._do_scroll)
 
@@ -120,80 +221,188 @@ class TranscriptionView(Gtk.Box):
         return GLib.SOURCE_REMOVE
 
 
-    def add_segment(self, segment_data: Dict[str, Any]):
+    def add_segment(self, segment_data: Union[SegmentData, Dict[str, Any]]):
         """Adds a new transcript segment to the list."""
-        print(f"TranscriptView: Adding segment [{segment_data.get('start', '?'):.2f}s->{segment_data.get('end', '?'):.2f}s] to UI.")
-        try:
-            text = segment_data['text'].strip()
-            start_ms = segment_data['start_ms']
-            end_ms = segment_data['end_ms']
-            segment_index = len(self._segments_data)
-            self._segments_data.append(segment_data)
+        if self._append_segment_data(segment_data):
+            self._update_realized_range()
+            self._scroll_to_bottom()
 
-            timestamp_str = f"{self._format_timestamp(start_ms)} → {self._format_timestamp(end_ms)}"
-
-            row = Gtk.ListBoxRow(
-                selectable=False,
-                activatable=False,
-            )
-            row.add_css_class("transcript-segment-row")
-
-            row_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4, margin_top=6, margin_bottom=6, margin_start=12, margin_end=12)
-            row_box.add_css_class("transcript-segment-content-box")
-            row.set_child(row_box)
-
-            text_label = Gtk.Label(
-                label=text,
-                wrap=True,
-                wrap_mode=Pango.WrapMode.WORD_CHAR,
-                justify=Gtk.Justification.LEFT,
-                xalign=0,
-                selectable=False,
-            )
-            text_label.add_css_class("transcript-segment-text-label")
-            row_box.append(text_label)
-
-            timestamp_label = Gtk.Label(
-                label=timestamp_str,
-                xalign=0,
-                css_classes=["timestamp-label", "monospace"],
-            )
-            attrs = Pango.AttrList.new()
-            attrs.insert(Pango.attr_family_new("monospace"))
-            grey_color = Gdk.RGBA()
-            grey_color.parse("#888")
-            attrs.insert(Pango.attr_foreground_new(int(grey_color.red * 65535), int(grey_color.green * 65535), int(grey_color.blue * 65535)))
-            timestamp_label.set_attributes(attrs)
-
-            row_box.append(timestamp_label)
-
-            button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8, halign=Gtk.Align.END)
-            button_box.add_css_class("transcript-segment-button-box")
-            row_box.append(button_box)
-
-            remove_button = Gtk.Button(
-                label="Remove",
-                css_classes=["destructive-action"],
-            )
-            remove_button.connect("clicked", self._on_remove_segment_clicked, row, segment_index)
-            remove_button.add_css_class("transcript-segment-remove-button")
-            button_box.append(remove_button)
-
-            copy_button = Gtk.Button(
-                label="Copy",
-                css_classes=["suggested-action"],
-            )
-            copy_button.connect("clicked", self._on_copy_segment_clicked, text)
-            copy_button.add_css_class("transcript-segment-copy-button")
-            button_box.append(copy_button)
-
-            self.list_box.append(row)
+    def add_segments(self, segments: List[Union[SegmentData, Dict[str, Any]]]):
+        """Adds several segments, updating the realized rows and scroll position once."""
+        added = False
+        for segment_data in segments:
+            added = self._append_segment_data(segment_data) or added
+        if added:
+            self._update_realized_range()
             self._scroll_to_bottom()
 
+    def _append_segment_data(self, segment_data: Union[SegmentData, Dict[str, Any]]) -> bool:
+        """Stores a segment and its row markup. Returns False if the segment is malformed."""
+        try:
+            if not isinstance(segment_data, SegmentData):
+                # Live segments arrive as transcriber dicts.
+                segment_data = SegmentData.from_dict(segment_data)
+            # Escaped once here; rows realized later just reuse the string.
+            markup = self._build_segment_markup(segment_data)
+            self._segments_data.append(segment_data)
+            self._segment_markup.append(markup)
+            self._row_heights.append(0)
+            self._row_offsets = None
+            return True
+
         except KeyError as e:
             log.error(f"Missing key in segment data: {e}. Data: {segment_data}")
         except Exception as e:
             log.exception(f"Error adding segment: {e}")
+        return False
+
+    def _build_segment_markup(self, segment_data: SegmentData) -> str:
+        """Returns the Pango markup for a segment: text, then its dimmed timestamp line."""
+        text = GLib.markup_escape_text(segment_data.text.strip())
+        timestamp_str = self._format_time_range(segment_data.start_ms, segment_data.end_ms)
+        # CSS classes can't reach a span, so the .timestamp-label look (small,
+        # monospace, 70% opacity) is reproduced here. alpha dims the theme's text
+        # colour instead of fixing one, so it follows dark mode.
+        return f"{text}\n<span font_family='monospace' size='small' alpha='70%'>{timestamp_str}</span>"
+
+    def _on_scroll(self, adjustment):
+        self._update_realized_range()
+
+    def _on_adjustment_changed(self, adjustment):
+        # "changed" fires after every layout, including the one caused by resizing
+        # the spacers below, so the update is coalesced into a single idle.
+        if not self._range_update_source:
+            self._range_update_source = GLib.idle_add(self._on_range_update_idle)
+
+    def _on_range_update_idle(self):
+        self._range_update_source = 0
+        self._update_realized_range()
+        return GLib.SOURCE_REMOVE
+
+    def _measure_realized_rows(self):
+        """Records the allocated height of every realized row."""
+        for index, row in self._segment_rows.items():
+            height = row.get_height()
+            if height > 0 and height != self._row_heights[index]:
+                self._row_heights[index] = height
+                self._row_offsets = None
+
+    def _get_row_offsets(self) -> List[int]:
+        """
+        Returns the top offset of every segment plus the total height (n + 1 entries).
+        Rows that were never realized count as the mean of the measured ones.
+        """
+        if self._row_offsets is None:
+            measured = [h for h in self._row_heights if h]
+            estimate = sum(measured) // len(measured) if measured else _ROW_HEIGHT_ESTIMATE
+            self._row_offsets = [0]
+            self._row_offsets.extend(itertools.accumulate(h or estimate for h in self._row_heights))
+        return self._row_offsets
+
+    def _compute_visible_range(self) -> Tuple[int, int]:
+        """Returns the (lo, hi) segment index range covering the viewport plus margin."""
+        n_segments = len(self._segments_data)
+        adjustment = self.scrolled_window.get_vadjustment()
+        if not adjustment or adjustment.get_page_size() <= 0:
+            # Not allocated yet: realize the tail, which is where new segments land.
+            return max(0, n_segments - _WINDOW_MARGIN_ROWS), n_segments
+        value = adjustment.get_value()
+        page_size = adjustment.get_page_size()
+        offsets = self._get_row_offsets()
+        lo = bisect.bisect_right(offsets, value) - 1 - _WINDOW_MARGIN_ROWS
+        hi = bisect.bisect_left(offsets, value + page_size) + _WINDOW_MARGIN_ROWS
+        return max(0, min(lo, n_segments)), max(0, min(hi, n_segments))
+
+    def _update_realized_range(self, force: bool = False):
+        """
+        Realizes rows for segments inside the visible range and destroys the rest.
+        Spacers above and below the list stand in for unrealized rows, sized from
+        the measured heights of those rows so the content does not jump when the
+        window shifts and the scrollbar reflects the full transcript length.
+        """
+        self._measure_realized_rows()
+        lo, hi = self._compute_visible_range()
+        offsets = self._get_row_offsets()
+        self._set_spacer_height(self._top_spacer, offsets[lo])
+        self._set_spacer_height(self._bottom_spacer, offsets[-1] - offsets[hi])
+        if not force and (lo, hi) == self._realized_range:
+            return
+
+        for index in [i for i in self._segment_rows if not lo <= i < hi]:
+            self.list_box.remove(self._segment_rows.pop(index))
+
+        # Rows with a smaller index in [lo, index) are already present when
+        # index is inserted, so its list position is always index - lo.
+        for index in range(lo, hi):
+            if index not in self._segment_rows:
+                row = self._make_row(index)
+                self._segment_rows[index] = row
+                self.list_box.insert(row, index - lo)
+
+        self._realized_range = (lo, hi)
+
+    @staticmethod
+    def _set_spacer_height(spacer: Gtk.Box, height: int):
+        # Only a real change queues a resize, so a settled layout stays settled.
+        if spacer.get_size_request()[1] != height:
+            spacer.set_size_request(-1, height)
+
+    def _clear_realized_rows(self):
+        for row in self._segment_rows.values():
+            self.list_box.remove(row)
+        self._segment_rows.clear()
+        self._realized_range = (0, 0)
+
+    def _make_row(self, segment_index: int) -> Gtk.ListBoxRow:
+        """Builds the widget tree for the segment at segment_index."""
+        row = Gtk.ListBoxRow(
+            selectable=False,
+            activatable=False,
+        )
+        row.add_css_class("transcript-segment-row")
+
+        row_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4, margin_top=6, margin_bottom=6, margin_start=12, margin_end=12)
+        row_box.add_css_class("transcript-segment-content-box")
+        row.set_child(row_box)
+
+        segment_label = Gtk.Label(
+            use_markup=True,
+            label=self._segment_markup[segment_index],
+            wrap=True,
+            wrap_mode=Pango.WrapMode.WORD_CHAR,
+            # Rows always fill the list width, so skip the extra wrapped
+            # natural-size measurement Gtk.Label does by default.
+            natural_wrap_mode=Gtk.NaturalWrapMode.NONE,
+            justify=Gtk.Justification.LEFT,
+            xalign=0,
+            selectable=False,
+        )
+        segment_label.add_css_class("transcript-segment-text-label")
+        row_box.append(segment_label)
+
+        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8, halign=Gtk.Align.END)
+        button_box.add_css_class("transcript-segment-button-box")
+        row_box.append(button_box)
+
+        remove_button = Gtk.Button(
+            label="Remove",
+            css_classes=["destructive-action"],
+        )
+        remove_button.set_action_name("segments.remove-segment")
+        remove_button.set_action_target_value(GLib.Variant("i", segment_index))
+        remove_button.add_css_class("transcript-segment-remove-button")
+        button_box.append(remove_button)
+
+        copy_button = Gtk.Button(
+            label="Copy",
+            css_classes=["suggested-action"],
+        )
+        copy_button.set_action_name("segments.copy-segment")
+        copy_button.set_action_target_value(GLib.Variant("i", segment_index))
+        copy_button.add_css_class("transcript-segment-copy-button")
+        button_box.append(copy_button)
+
+        return row
 
 
     def update_progress(self, overall_pct: float, segments_done: int = 0, model_download_pct: float = -1.0):
@@ -241,13 +450,13 @@ class TranscriptionView(Gtk.Box):
     def reset_view(self):
         """Clears all segments and resets progress."""
         log.info("Resetting TranscriptionView")
-        child = self.list_box.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.list_box.remove(child)
-            child = next_child
-
+        self._clear_realized_rows()
         self._segments_data.clear()
+        self._segment_markup.clear()
+        self._row_heights.clear()
+        self._row_offsets = None
+        self._top_spacer.set_size_request(-1, 0)
+        self._bottom_spacer.set_size_request(-1, 0)
         self.current_item = None # Clear the loaded item
         # Need to add a progress_bar attribute first
         # self.update_progress(0.0)
@@ -256,50 +465,35 @@ class TranscriptionView(Gtk.Box):
         adjustment = self.scrolled_window.get_vadjustment()
         if adjustment:
             adjustment.set_value(0)
-        
-        # Update save/export action sensitivity via a signal or direct call if window is accessible
-        # This assumes the parent window might listen for a signal or this view is part of a larger controller.
-        # For now, this is a placeholder for how the window's save/export actions get updated.
-        parent_window = self.get_ancestor(Adw.ApplicationWindow) # noqa: F841, E501 (keep for now if other uses, but remove the GLib.idle_add below)
-        # if parent_window and hasattr(parent_window, '_set_active_view') and hasattr(parent_window, 'leaflet'):
-        #      # This call is problematic and might be causing the view to flip back.
-        #      # The window._set_active_view should handle sensitivity when it switches to this view.
-        #      # GLib.idle_add(parent_window._set_active_view, parent_window.leaflet.get_visible_child_name())
-        #      pass # Window._set_active_view will handle sensitivity
-        # The main window is responsible for setting action sensitivity when it activates this view.
-
-
-    def load_transcript(self, transcript_item: TranscriptItem):
+
+
+    def load_transcript(self, transcript_item: TranscriptItem, segments_data: Optional[List[SegmentData]] = None):
         """
         Loads a full TranscriptItem into the view, replacing current content.
+        segments_data may be passed in when build_segment_data() was already run
+        for the item's segments (e.g. on a worker thread).
         """
         self.reset_view() # Clear existing content
         self.current_item = transcript_item
+        if transcript_item.timestamp:
+            self._json_timestamp_for(transcript_item.timestamp) # Prime the cache for saving
         log.info(f"Loading TranscriptItem {transcript_item.uuid} into view.")
 
-        if transcript_item.segments:
-            for seg_item_obj in transcript_item.segments:
-                # Convert SegmentItem object to the dict format add_segment expects
-                segment_data_for_ui = {
-                    'text': seg_item_obj.text,
-                    'start': seg_item_obj.start, # add_segment expects start_ms, end_ms
-                    'end': seg_item_obj.end,
-                    'start_ms': int(seg_item_obj.start * 1000),
-                    'end_ms': int(seg_item_obj.end * 1000),
-                    'speaker': seg_item_obj.speaker
-                    # 'id' will be assigned by add_segment based on current _segments_data length
-                }
-                self.add_segment(segment_data_for_ui)
-        
-        # Update save/export action sensitivity
-        parent_window = self.get_ancestor(Adw.ApplicationWindow) # noqa: F841, E501 (keep for now if other uses, but remove the GLib.idle_add below)
-        # if parent_window and hasattr(parent_window, '_set_active_view') and hasattr(parent_window, 'leaflet'):
-        #      # This call is problematic and might be causing the view to flip back.
-        #      # The window._set_active_view should handle sensitivity when it switches to this view.
-        #      # GLib.idle_add(parent_window._set_active_view, parent_window.leaflet.get_visible_child_name())
-        #      pass # Window._set_active_view will handle sensitivity
-        # The main window is responsible for setting action sensitivity when it activates this view.
+        if segments_data is None and transcript_item.segments:
+            segments_data = build_segment_data(transcript_item.segments)
+        if segments_data:
+            # One realize/scroll pass for the whole load.
+            self.add_segments(segments_data)
+
 
+    def set_current_item(self, transcript_item: TranscriptItem):
+        """
+        Makes transcript_item the view's current item without reloading segments,
+        e.g. once the segments on display have been saved as that item.
+        """
+        self.current_item = transcript_item
+        if transcript_item.timestamp:
+            self._json_timestamp_for(transcript_item.timestamp) # Prime the cache for saving
 
     def has_content(self) -> bool:
         """
@@ -313,42 +507,84 @@ class TranscriptionView(Gtk.Box):
         """
         return self.current_item
 
-    def get_transcript_data_for_saving(self) -> Optional[Dict[str, Any]]:
+    def get_transcript_data_for_saving_async(self, callback: Callable[[Optional[Dict[str, Any]]], Any]):
         """
-        Constructs a dictionary representing the current transcript state for saving.
-        This should be compatible with what TranscriptItem.to_dict() would produce
-        or what atomic_write_json expects.
+        Builds the save dict (see snapshot_transcript_data_for_saving()) on a worker
+        thread. callback is invoked on the main loop with the dict (or None if there
+        is no content).
+        """
+        build_data = self.snapshot_transcript_data_for_saving()
+        if build_data is None:
+            GLib.idle_add(callback, None)
+            return
+
+        def worker():
+            try:
+                data = build_data()
+            except Exception as e:
+                log.exception(f"Error preparing transcript data for saving: {e}")
+                data = None
+            GLib.idle_add(callback, data)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def snapshot_transcript_data_for_saving(self) -> Optional[Callable[[], Dict[str, Any]]]:
+        """
+        Captures the current segments and item metadata on the main thread and returns a
+        callable that builds the transcript dict for saving from them on any thread, or
+        None if there is no content. The dict is compatible with what
+        TranscriptItem.to_dict() produces.
         """
         if not self.has_content():
             return None
+        # The list is copied so later removals don't affect the builder; the segment
+        # records themselves are never mutated in place and are shared by reference.
+        return functools.partial(self._build_save_dict, list(self._segments_data), self._snapshot_item_metadata())
 
+    def _snapshot_item_metadata(self) -> Optional[Dict[str, Any]]:
+        """Reads the loaded item's metadata on the main thread for use by _build_save_dict."""
+        if not self.current_item:
+            return None
+        return {
+            "uuid": self.current_item.uuid,
+            # timestamp should be in YYYYMMDD_HHMMSS for JSON
+            "timestamp": self._json_timestamp_for(self.current_item.timestamp) if self.current_item.timestamp else GLib.DateTime.new_now_local().format("%Y%m%d_%H%M%S"),
+            "language": self.current_item.language,
+            "source_path": self.current_item.audio_source_path, # Media path
+            "output_filename": self.current_item.output_filename # JSON filename
+        }
+
+    def _json_timestamp_for(self, timestamp: str) -> str:
+        """Converts an item timestamp to the JSON YYYYMMDD_HHMMSS form, reusing the last result."""
+        cached = self._saved_timestamp_cache
+        if cached and cached[0] == timestamp:
+            return cached[1]
+        formatted = GLib.DateTime.new_from_iso8601(timestamp + "Z", None).format("%Y%m%d_%H%M%S")
+        self._saved_timestamp_cache = (timestamp, formatted)
+        return formatted
+
+    @staticmethod
+    def _build_save_dict(segments: List[SegmentData], metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Pure function over its arguments so it can run off the main thread."""
         # Consolidate text from segments
-        full_text = " ".join(seg.get('text', '') for seg in self._segments_data).strip()
-        
+        full_text = " ".join(seg.text for seg in segments).strip()
+
         # Prepare segments in the format expected by TranscriptItem.to_dict()
         # (start, end, text, speaker)
         segments_for_json = []
-        for seg_ui_data in self._segments_data:
+        for seg_ui_data in segments:
             segments_for_json.append({
-                "start": round(seg_ui_data.get('start', 0.0), 3),
-                "end": round(seg_ui_data.get('end', 0.0), 3),
-                "text": seg_ui_data.get('text', "").strip(),
-                "speaker": seg_ui_data.get('speaker', "") # Assuming speaker might be edited in UI later
+                "start": round(seg_ui_data.start, 3),
+                "end": round(seg_ui_data.end, 3),
+                "text": seg_ui_data.text.strip(),
+                "speaker": seg_ui_data.speaker # Assuming speaker might be edited in UI later
             })
 
         # If there's a current_item, use its metadata as a base
-        if self.current_item:
-            data = {
-                "uuid": self.current_item.uuid,
-                # timestamp should be in YYYYMMDD_HHMMSS for JSON
-                "timestamp": GLib.DateTime.new_from_iso8601(self.current_item.timestamp + "Z", None).format("%Y%m%d_%H%M%S") if self.current_item.timestamp else GLib.DateTime.new_now_local().format("%Y%m%d_%H%M%S"),
-                "text": full_text,
-                "segments": segments_for_json,
-                "language": self.current_item.language,
-                "source_path": self.current_item.audio_source_path, # Media path
-                "audio_source_path": self.current_item.audio_source_path, # Media path
-                "output_filename": self.current_item.output_filename # JSON filename
-            }
+        if metadata:
+            data = dict(metadata)
+            data["text"] = full_text
+            data["segments"] = segments_for_json
         else:
             # This is a new, unsaved transcript (e.g., from live recording not yet auto-saved)
             # Some fields will be generated fresh by the save logic in window.py
@@ -365,7 +601,7 @@ class TranscriptionView(Gtk.Box):
         Retrieves the clean, concatenated transcript text from all segments.
         This is primarily for exports like .txt where only the speech content is desired.
         """
-        if not hasattr(self, '_segments_data') or not self._segments_data:
+        if not self._segments_data:
             return ""
         
         # Concatenate text from all segments, separated by a space or newline.
@@ -375,16 +611,11 @@ class TranscriptionView(Gtk.Box):
         # Let's go with newline separation for now, as it's often useful.
         
         text_parts = []
-        for segment_dict in self._segments_data:
-            segment_text = segment_dict.get("text", "")
+        for segment in self._segments_data:
+            segment_text = segment.text
             if isinstance(segment_text, str):
                 text_parts.append(segment_text.strip())
             else:
                 log.warning(f"Segment data 'text' is not a string: {segment_text}. Skipping.")
         
         return "\n".join(text_parts) # Or " ".join(text_parts) if single line is preferred
-
-    def _format_timestamp_plain(self, seconds: float) -> str:
-        minutes = int(seconds) // 60
-        seconds = int(seconds) % 60
-        return f"{minutes:02}:{seconds:02}"
\ No newline at end of file
@@ -4,35 +4,129 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
 from gi.repository import Gtk, Adw, GLib, Gio, Gdk, Pango
+import collections
+import functools
+import logging
+import threading
 import wave
 import tempfile
 import os
 import re
+import shutil
+import stat
+import uuid
 import json # Added for JSON export
 from datetime import datetime # Added for default filenames
 import importlib.resources # Added for package-relative paths
 import pathlib # Added for path manipulation
+from types import MappingProxyType
 
-from typing import Optional, Any
+from typing import TYPE_CHECKING, Optional
 from .audio.capture import AudioCapturer
-from .views.transcript_view import TranscriptionView
 from .views.initial_view import InitialView
-from .transcription.transcriber import Transcriber
-from .views.history_view import HistoryView
 from .models.transcript_item import TranscriptItem, SegmentItem
 from .utils import export as export_utils # Added
-from .utils.io import atomic_write_json # Added
+from .utils.io import atomic_write_json, dump_json_bytes # Added
+from .utils.uuid_index import find_transcript_by_uuid, record_transcript
 from .ui.toast import ToastPresenter # Added for toast framework
 
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime; see the transcript_view/history_view/transcriber properties.
+    from .views.transcript_view import TranscriptionView
+    from .views.history_view import HistoryView
+    from .transcription.transcriber import Transcriber
+
 # Define the base path for data files within the gnomerecast package
 _GNOMERECAST_DATA_ROOT = importlib.resources.files('gnomerecast') / 'data'
 
-LANGUAGE_MAP = {"auto": "Auto Detect", "en": "English", "es": "Spanish"}
-REVERSE_LANGUAGE_MAP = {v: k for k, v in LANGUAGE_MAP.items()}
+# "00".."99" for the recording timer label, so ticks do not format numbers.
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+
+# Decoded sidebar icons, keyed by path relative to _GNOMERECAST_DATA_ROOT; shared by all windows.
+_ICON_CACHE: dict[str, Gdk.Texture] = {}
+
+# Read-only views; these tables are fixed for the lifetime of the process.
+LANGUAGE_MAP = MappingProxyType({"auto": "Auto Detect", "en": "English", "es": "Spanish"})
+REVERSE_LANGUAGE_MAP = MappingProxyType({v: k for k, v in LANGUAGE_MAP.items()})
+
+MODE_MAP = MappingProxyType({"fast": "Fast", "balanced": "Balanced", "accurate": "Accurate"})
+MODE_TO_MODEL = MappingProxyType({"fast": "tiny", "balanced": "base", "accurate": "small"})
+MODEL_TO_MODE = MappingProxyType({v: k for k, v in MODE_TO_MODEL.items()})
+
+# Export formats by file extension, and by export dialog filter name (format, extension to append).
+_EXT_TO_FORMAT = MappingProxyType({".txt": "txt", ".md": "md", ".srt": "srt", ".json": "json"})
+_FILTER_NAME_TO_FORMAT = MappingProxyType({
+    "Plain Text (*.txt)": ("txt", ".txt"),
+    "Markdown (*.md)": ("md", ".md"),
+    "SubRip Subtitle (*.srt)": ("srt", ".srt"),
+    "JSON Transcript (*.json)": ("json", ".json"),
+})
+
+# Stateless window actions: (name, handler method, initially enabled, accelerators, attribute kept in).
+# Export and save start disabled and are enabled once the transcript view has content.
+_SIMPLE_ACTIONS = (
+    ("export-transcript", "_on_export_transcript", False, (), "_export_action"),
+    ("save-transcript", "_on_save_transcript", False, ("<Control>s",), "_save_action"),
+    ("save-transcript-as", "_on_save_transcript_as", False, ("<Control><Shift>s",), "_save_as_action"),
+    ("open-file", "_on_open_file_activate", True, ("<Control>o",), None),
+)
+
+# Matches a reader-style "[mm:ss → mm:ss]" timestamp line.
+_TS_LINE_RE = re.compile(r"^\[\d{2}:\d{2}\s*→\s*\d{2}:\d{2}\]\n?", re.MULTILINE)
+
+
+def _compact_ts(timestamp: str) -> str:
+    """Rewrites an item timestamp, YYYY-MM-DD HH:MM:SS, into the JSON form YYYYMMDD_HHMMSS."""
+    # TranscriptItem always stores this fixed layout, so slicing replaces a strptime/strftime pair.
+    return f"{timestamp[0:4]}{timestamp[5:7]}{timestamp[8:10]}_{timestamp[11:13]}{timestamp[14:16]}{timestamp[17:19]}"
+
+
+def _build_choice_menu(action_name: str, labels: dict, keys) -> Gio.Menu:
+    """Builds a menu with one item per key, targeting action_name::key."""
+    menu = Gio.Menu()
+    for key in keys:
+        menu.append_item(Gio.MenuItem.new(labels[key], f"{action_name}::{key}"))
+    return menu
+
+_STRING_VARIANT_TYPE = GLib.VariantType.new('s')
+_STRING_VARIANT_CACHE: dict[str, GLib.Variant] = {}
+
+
+def _string_variant(value: str) -> GLib.Variant:
+    """Returns a shared (immutable) GLib.Variant for the string action state value."""
+    variant = _STRING_VARIANT_CACHE.get(value)
+    if variant is None:
+        variant = _STRING_VARIANT_CACHE[value] = GLib.Variant.new_string(value)
+    return variant
+
+# Header-bar menus are identical for every window, so they are built once at import.
+_MODE_MENU = _build_choice_menu("win.select-mode", MODE_MAP, ("accurate", "balanced", "fast"))
+_LANGUAGE_MENU = _build_choice_menu("win.select-language", LANGUAGE_MAP, LANGUAGE_MAP)
+
+class _PendingExportItem:
+    """
+    Stands in for a TranscriptItem when exporting view content that has no loaded item;
+    the real item is only built by materialize(), on the export worker.
+    """
+    __slots__ = ('build_view_data', 'output_filename')
+
+    def __init__(self, build_view_data, output_filename: str):
+        self.build_view_data = build_view_data
+        self.output_filename = output_filename
+
+    def materialize(self) -> TranscriptItem:
+        view_data = self.build_view_data()
+        item = TranscriptItem(
+            source_path="", # No source path for an unsaved item
+            transcript_text=view_data.get("text", ""),
+            segments=[SegmentItem(**s) for s in view_data.get("segments", [])], # Reconstruct SegmentItem objects
+            language=view_data.get("language", "en")
+        )
+        item.output_filename = self.output_filename
+        return item
 
-MODE_MAP = {"fast": "Fast", "balanced": "Balanced", "accurate": "Accurate"}
-MODE_TO_MODEL = {"fast": "tiny", "balanced": "base", "accurate": "small"}
-MODEL_TO_MODE = {v: k for k, v in MODE_TO_MODEL.items()}
 
 class GnomeRecastWindow(Adw.ApplicationWindow):
     """The main application window for GnomeRecast."""
@@ -41,17 +135,64 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
     def __init__(self, app_menu: Optional[Gio.MenuModel] = None, **kwargs):
         super().__init__(**kwargs)
 
+        # The application is fixed for the window's lifetime; its shared I/O pool and
+        # save queue are resolved once instead of on every save, export and import.
+        self._app = self.get_application()
+        self._io_pool = getattr(self._app, 'io_pool', None)
+        self._save_queue = getattr(self._app, 'save_queue', None)
+        if self._io_pool is None:
+            logger.warning("GnomeRecastWindow: I/O thread pool not available on application object.")
+
         self.settings = Gio.Settings.new("org.hardcoeur.Recast")
+        # Mirrors of the keys the header buttons display; refreshed only by changed:: handlers.
+        self._cached_model = self.settings.get_string("default-model")
+        self._cached_mode_key = MODEL_TO_MODE.get(self._cached_model, "balanced") # Derived from _cached_model
+        self._cached_lang = self.settings.get_string("target-language")
+        self._cached_autodetect = self.settings.get_boolean("auto-detect-language")
 
         self.set_title("")
         self.set_default_size(800, 600)
 
         self.recording_audio_capturer = None
-        self.recording_audio_buffer = bytearray()
-
-        self.transcriber = Transcriber()
+        # Captured PCM is streamed into this WAV file from the GStreamer streaming
+        # thread; _recording_lock guards the writer against close on the main loop.
+        self._recording_wav: Optional[wave.Wave_write] = None
+        self._recording_file = None # File object under _recording_wav; wave does not close it
+        self._recording_wav_path: Optional[str] = None
+        self._recording_lock = threading.Lock()
+        self.recording_audio_nbytes = 0
+        self._recordings_dir: Optional[str] = None # Per-session temp dir for recorded WAVs, created on first use
+        # Imports and Save-As default to this directory; resolved and created once per window.
+        self._transcripts_dir = os.path.join(GLib.get_user_data_dir(), 'GnomeRecast', 'transcripts')
+        os.makedirs(self._transcripts_dir, exist_ok=True)
+        self.connect("close-request", self._on_close_request)
+
+        # Transcribed segments waiting for the next idle flush into the transcript view.
+        self._pending_segments = collections.deque()
+        self._pending_segments_lock = threading.Lock()
+        self._segment_flush_scheduled = False
+
+        self._transcriber: Optional["Transcriber"] = None # Created on first transcription
         self._selected_history_transcript: Optional[TranscriptItem] = None
+        self._selected_history_segments: list[SegmentItem] = [] # SegmentItems of the selection, filtered once
+        self._reader_window: Optional[Adw.ApplicationWindow] = None # Built on first Reader click, then reused
+        self._reader_buffer: Optional[Gtk.TextBuffer] = None
+        self._reader_text_uuid: Optional[str] = None # Item whose text the reader buffer currently holds
+        # File dialog filters, built on first use and reused by every dialog.
+        self._export_filters: Optional[tuple[Gio.ListStore, dict[str, Gtk.FileFilter]]] = None
+        self._open_filters: Optional[tuple[Gio.ListStore, Gtk.FileFilter]] = None
+        self._save_filters: Optional[tuple[Gio.ListStore, Gtk.FileFilter]] = None
+        self._default_save_folder = Gio.File.new_for_path(self._transcripts_dir)
         self.last_export_filter_name: Optional[str] = None # Added to store last export filter
+        # Window actions, kept for direct access; assigned by the _create_*_action(s) helpers.
+        self._mode_action: Optional[Gio.SimpleAction] = None
+        self._language_action: Optional[Gio.SimpleAction] = None
+        # Last state pushed to each action, so label updates need not read it back as a Variant.
+        self._mode_state_key: Optional[str] = None
+        self._language_state_key: Optional[str] = None
+        self._export_action: Optional[Gio.SimpleAction] = None
+        self._save_action: Optional[Gio.SimpleAction] = None
+        self._save_as_action: Optional[Gio.SimpleAction] = None
 
         self.header_bar = Adw.HeaderBar()
         self.header_bar.add_css_class("window-header-bar")
@@ -66,7 +207,7 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
              self.main_menu_button.set_menu_model(app_menu)
         else:
              self.main_menu_button.set_sensitive(False)
-             print("Warning: No app_menu model received by window, disabling menu button.")
+             logger.warning("Warning: No app_menu model received by window, disabling menu button.")
         self.header_bar.pack_end(self.main_menu_button)
 
         self.reader_button = Gtk.Button(label="Reader")
@@ -76,22 +217,14 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
         self.reader_button.connect("clicked", self._on_reader_button_clicked)
         self.header_bar.pack_end(self.reader_button)
 
-        mode_menu = Gio.Menu()
-        mode_menu.append_item(Gio.MenuItem.new(MODE_MAP['accurate'], 'win.select-mode::accurate'))
-        mode_menu.append_item(Gio.MenuItem.new(MODE_MAP['balanced'], 'win.select-mode::balanced'))
-        mode_menu.append_item(Gio.MenuItem.new(MODE_MAP['fast'], 'win.select-mode::fast'))
         self.mode_button = Gtk.MenuButton(
-            menu_model=mode_menu,
+            menu_model=_MODE_MENU,
             tooltip_text="Choose transcription accuracy mode"
         )
         self.header_bar.pack_end(self.mode_button)
 
-        language_menu = Gio.Menu()
-        language_menu.append_item(Gio.MenuItem.new(LANGUAGE_MAP['auto'], 'win.select-language::auto'))
-        language_menu.append_item(Gio.MenuItem.new(LANGUAGE_MAP['en'], 'win.select-language::en'))
-        language_menu.append_item(Gio.MenuItem.new(LANGUAGE_MAP['es'], 'win.select-language::es'))
         self.language_button = Gtk.MenuButton(
-            menu_model=language_menu,
+            menu_model=_LANGUAGE_MENU,
             tooltip_text="Choose transcription language"
         )
         self.header_bar.pack_end(self.language_button)
@@ -100,6 +233,7 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
         self.is_recording = False
         self.recording_timer_id = None
         self.recording_start_time = None
+        self._last_shown_seconds = 0
 
         self.recording_controls_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
         rec_icon = Gtk.Image(icon_name="media-record-symbolic")
@@ -116,12 +250,9 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
 
 
         self.initial_view = InitialView()
-        self.transcript_view = TranscriptionView()
-        # Pass the application instance to HistoryView
-        app_instance = self.get_application()
-        self.history_view = HistoryView(application=app_instance, on_transcript_selected=self._load_transcript_from_history)
-        self.history_view.connect("transcript-selected", self._on_history_item_selected)
-
+        # Built on first access by the transcript_view/history_view properties.
+        self._transcript_view: Optional["TranscriptionView"] = None
+        self._history_view: Optional["HistoryView"] = None
 
         self.initial_view.connect("start-recording", self.start_recording_ui)
         self.initial_view.connect("stop-recording", self._on_stop_recording_clicked)
@@ -133,17 +264,7 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
         self.leaflet.set_can_navigate_back(False)
         self.leaflet.set_can_navigate_forward(False)
 
-        self.leaflet.append(self.initial_view)
-        initial_page = self.leaflet.get_page(self.initial_view)
-        initial_page.set_property("name", "initial")
-
-        self.leaflet.append(self.transcript_view)
-        transcript_page = self.leaflet.get_page(self.transcript_view)
-        transcript_page.set_property("name", "transcript")
-
-        self.leaflet.append(self.history_view)
-        history_page = self.leaflet.get_page(self.history_view)
-        history_page.set_property("name", "history")
+        self._append_leaflet_page(self.initial_view, "initial")
 
         self._set_active_view("initial")
 
@@ -187,34 +308,105 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
         home_button.set_tooltip_text("Home (Themed Icon Test)")
         home_button.connect("clicked", self.show_initial_view)
         self.sidebar_vbox.append(home_button)
-        self._add_sidebar_button("icons/headset.png", self.show_transcript_view, "Transcribe")
-        self._add_sidebar_button("icons/history.png", self.show_history_view, "History")
+        # Icon decoding and the transcript page are not needed for the first frame.
+        self._deferred_build_id = GLib.idle_add(self._build_deferred, priority=GLib.PRIORITY_LOW)
 
 
         self._create_language_action()
         self._create_mode_action()
-        self._create_export_action()
-        self._create_save_action()
-        self._create_open_action() # Added
+        self._create_simple_actions()
 
         self._update_language_button_label()
         self._update_mode_button_label()
 
-        self.settings.connect("changed::target-language", lambda s, k: self._update_language_button_label())
-        self.settings.connect("changed::auto-detect-language", lambda s, k: self._update_language_button_label())
-        self.settings.connect("changed::default-model", lambda s, k: self._update_mode_button_label())
+        # Disconnected in _on_close_request so a closed window stops receiving changes.
+        self._settings_handler_ids = [
+            self.settings.connect("changed::target-language", self._on_language_setting_changed),
+            self.settings.connect("changed::auto-detect-language", self._on_language_setting_changed),
+            self.settings.connect("changed::default-model", self._on_model_setting_changed),
+        ]
+
+    def _on_language_setting_changed(self, settings, key):
+        if key == "auto-detect-language":
+            self._cached_autodetect = settings.get_boolean(key)
+        else:
+            self._cached_lang = settings.get_string(key)
+        self._update_language_button_label()
+
+    def _on_model_setting_changed(self, settings, key):
+        self._cached_model = settings.get_string(key)
+        self._cached_mode_key = MODEL_TO_MODE.get(self._cached_model, "balanced")
+        self._update_mode_button_label()
 
 
+    def _build_deferred(self):
+        """Low-priority idle: builds the parts of the window the initial view does not show."""
+        self._deferred_build_id = 0
+        self._add_sidebar_button("icons/headset.png", self.show_transcript_view, "Transcribe")
+        self._add_sidebar_button("icons/history.png", self.show_history_view, "History")
+        self.transcript_view # Warm the page so the first navigation does not build it
+        return GLib.SOURCE_REMOVE
+
+    def _ensure_deferred_built(self):
+        """Runs _build_deferred now if its idle callback has not fired yet."""
+        if self._deferred_build_id:
+            GLib.source_remove(self._deferred_build_id)
+            self._build_deferred()
+
+    @property
+    def transcript_view(self) -> "TranscriptionView":
+        """The transcript page, built and added to the leaflet on first access."""
+        if self._transcript_view is None:
+            from .views.transcript_view import TranscriptionView
+            self._transcript_view = TranscriptionView()
+            self._append_leaflet_page(self._transcript_view, "transcript")
+        return self._transcript_view
+
+    @property
+    def history_view(self) -> "HistoryView":
+        """The history page, built and added to the leaflet on first access."""
+        if self._history_view is None:
+            from .views.history_view import HistoryView
+            # Pass the application instance to HistoryView
+            self._history_view = HistoryView(application=self._app, on_transcript_selected=self._load_transcript_from_history)
+            self._history_view.connect("transcript-selected", self._on_history_item_selected)
+            self._append_leaflet_page(self._history_view, "history")
+        return self._history_view
+
+    @property
+    def transcriber(self) -> "Transcriber":
+        """Transcriber instance; importing it pulls in faster-whisper, so it is deferred."""
+        if self._transcriber is None:
+            from .transcription.transcriber import Transcriber
+            self._transcriber = Transcriber()
+        return self._transcriber
+
+    def _append_leaflet_page(self, child: Gtk.Widget, name: str):
+        self.leaflet.append(child)
+        self.leaflet.get_page(child).set_property("name", name)
+
+    def _refresh_history_list(self):
+        """Refreshes the history list if the history page has been built (it loads itself on creation)."""
+        # History content changed on disk; the reader buffer may be stale.
+        self._reader_text_uuid = None
+        if self._history_view is not None:
+            self._history_view.refresh_list()
+        return GLib.SOURCE_REMOVE
+
     def _add_sidebar_button(self, icon_path_str: str, callback, tooltip_text):
         """Creates a Gtk.Button with an icon, connects it, and adds it to the sidebar.
         icon_path_str should be relative to _GNOMERECAST_DATA_ROOT (e.g., 'icons/headset.png')
         """
-        icon_resource_ref = _GNOMERECAST_DATA_ROOT / icon_path_str
-        with importlib.resources.as_file(icon_resource_ref) as icon_file_path:
-            icon = Gtk.Picture.new_for_filename(str(icon_file_path))
-        icon.set_content_fit(Gtk.ContentFit.COVER)
-        icon.set_can_shrink(False)
-        icon.set_size_request(32, 32)
+        texture = _ICON_CACHE.get(icon_path_str)
+        if texture is None:
+            # Decode straight from the resource bytes; as_file() would extract a
+            # temporary copy on zipped installs.
+            icon_bytes = (_GNOMERECAST_DATA_ROOT / icon_path_str).read_bytes()
+            texture = Gdk.Texture.new_from_bytes(GLib.Bytes.new(icon_bytes))
+            _ICON_CACHE[icon_path_str] = texture
+        # A fixed-size Gtk.Image is enough for a 32px icon; Gtk.Picture adds content-fit scaling.
+        icon = Gtk.Image.new_from_paintable(texture)
+        icon.set_pixel_size(32)
         button = Gtk.Button()
         button.set_child(icon)
         button.set_tooltip_text(tooltip_text)
@@ -226,39 +418,105 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
         Centralized method to switch the visible child in the leaflet
         and update the state of related actions (e.g., export).
         """
-        if hasattr(self, 'leaflet') and self.leaflet:
-            self.leaflet.set_visible_child_name(view_name)
-            is_transcript_view_active = (view_name == "transcript")
-            
-            export_action = self.lookup_action("export-transcript")
-            if export_action:
-                # Enable export if transcript view is active AND has content
-                has_content_for_export = hasattr(self.transcript_view, 'has_content') and self.transcript_view.has_content()
-                export_action.set_enabled(is_transcript_view_active and has_content_for_export)
-
-            save_action = self.lookup_action("save-transcript")
-            if save_action:
-                 # Enable save if transcript view is active AND has content
-                has_content_for_save = hasattr(self.transcript_view, 'has_content') and self.transcript_view.has_content()
-                save_action.set_enabled(is_transcript_view_active and has_content_for_save)
-
-
-            if hasattr(self, "reader_button"):
-               is_history_view = (view_name == "history")
-               self.reader_button.set_visible(is_history_view)
-               if not is_history_view:
-                    self.reader_button.set_sensitive(False)
-                    self._selected_history_transcript = None
-
-            print(f"GnomeRecastWindow: Switched active view to '{view_name}'.")
-        else:
-            print(f"GnomeRecastWindow: Error - Leaflet not found when trying to set active view to '{view_name}'.")
-
+        # Lazily built pages are created when first navigated to.
+        if view_name == "transcript":
+            self.transcript_view
+        elif view_name == "history":
+            self.history_view
+        self.leaflet.set_visible_child_name(view_name)
+        # Export and save need the transcript view to be active AND have content.
+        # GSimpleAction only emits notify::enabled when the value actually changes.
+        actions_enabled = (view_name == "transcript"
+                           and self._transcript_view is not None and self._transcript_view.has_content())
+
+        if self._export_action:
+            self._export_action.set_enabled(actions_enabled)
+
+        if self._save_action:
+            self._save_action.set_enabled(actions_enabled)
+
+        if self._save_as_action:
+            self._save_as_action.set_enabled(actions_enabled)
+
+        is_history_view = (view_name == "history")
+        self.reader_button.set_visible(is_history_view)
+        if not is_history_view:
+            self.reader_button.set_sensitive(False)
+            self._set_selected_history_transcript(None)
+
+        logger.debug("GnomeRecastWindow: Switched active view to '%s'.", view_name)
+
+
+    def _on_close_request(self, window):
+        """Releases settings handlers, main-context sources, the recording files and auxiliary windows owned by the window."""
+        for handler_id in self._settings_handler_ids:
+            self.settings.disconnect(handler_id)
+        self._settings_handler_ids = []
+        self._close_recording_wav()
+        if self._recordings_dir is not None:
+            # Also removes recordings whose transcription failed or never finished.
+            shutil.rmtree(self._recordings_dir, ignore_errors=True)
+            self._recordings_dir = None
+        if self._deferred_build_id:
+            GLib.source_remove(self._deferred_build_id)
+            self._deferred_build_id = 0
+        if self._reader_window is not None:
+            # A hidden reader window would otherwise keep the application running.
+            self._reader_window.destroy()
+            self._reader_window = None
+        return False
 
     def _on_recording_audio_data(self, audio_data):
-        """Callback function to receive audio data chunks during recording."""
-        if self.is_recording and self.recording_audio_buffer is not None:
-            self.recording_audio_buffer.extend(audio_data)
+        """Callback function to receive audio data chunks during recording (capture thread)."""
+        with self._recording_lock:
+            if self._recording_wav is not None:
+                # writeframesraw skips the per-call header patch; close() patches it once.
+                self._recording_wav.writeframesraw(audio_data)
+                self.recording_audio_nbytes += len(audio_data)
+
+    def _open_recording_wav(self):
+        """Creates the temporary WAV file the next recording is streamed into."""
+        if self._recordings_dir is None:
+            self._recordings_dir = tempfile.mkdtemp(prefix="gnomerecast-")
+        fd, temp_wav_path = tempfile.mkstemp(suffix=".wav", dir=self._recordings_dir)
+        logger.debug("GnomeRecastWindow: Recording to temporary WAV file: %s", temp_wav_path)
+        # The file is opened once by mkstemp; wave writes through that descriptor.
+        wav_file = os.fdopen(fd, 'wb')
+        wf = wave.open(wav_file, 'wb')
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        with self._recording_lock:
+            self._recording_wav = wf
+            self._recording_file = wav_file
+            self._recording_wav_path = temp_wav_path
+            self.recording_audio_nbytes = 0
+
+    def _detach_recording_wav(self) -> Optional[tuple]:
+        """Takes the recording writer away from the capture callback; returns (wave, file, path) or None."""
+        with self._recording_lock:
+            wf, wav_file, path = self._recording_wav, self._recording_file, self._recording_wav_path
+            self._recording_wav = None
+            self._recording_file = None
+            self._recording_wav_path = None
+        return None if wf is None else (wf, wav_file, path)
+
+    def _close_recording_wav(self) -> Optional[str]:
+        """Finalizes the recording WAV file, if any, and returns its path."""
+        recording = self._detach_recording_wav()
+        return None if recording is None else self._finalize_recording_wav(recording)
+
+    def _finalize_recording_wav(self, recording: tuple) -> Optional[str]:
+        """Flushes and closes a detached recording; returns its path, or None on failure."""
+        wf, wav_file, path = recording
+        try:
+            with wav_file:
+                wf.close() # Patches the RIFF header with the final frame count
+        except OSError as e:
+            logger.error("GnomeRecastWindow: Error finalizing WAV file %s: %s", path, e)
+            ToastPresenter.show(self, f"❌ Could not save recording: {e}")
+            return None
+        return path
 
     def show_transcript_view(self, sender, transcript_item=None):
         """
@@ -267,54 +525,52 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
         Switches the main view to the transcript view and loads the selected item if provided.
         """
         from .models.transcript_item import TranscriptItem
+        self._ensure_deferred_built()
 
         if transcript_item:
             if not isinstance(transcript_item, TranscriptItem):
-                print(f"Error in show_transcript_view: Expected TranscriptItem, got {type(transcript_item)}")
+                logger.error("Error in show_transcript_view: Expected TranscriptItem, got %s", type(transcript_item))
                 return
-            print(f"GnomeRecastWindow: Received history-item-activated for {transcript_item.uuid}")
+            logger.debug("GnomeRecastWindow: Received history-item-activated for %s", transcript_item.uuid)
         else:
             if isinstance(sender, Gtk.Button):
-                 print("GnomeRecastWindow: Sidebar 'Transcribe' button clicked. Navigating to transcript view.")
+                 logger.debug("GnomeRecastWindow: Sidebar 'Transcribe' button clicked. Navigating to transcript view.")
             else:
-                 print("GnomeRecastWindow: show_transcript_view called without item. Navigating to transcript view.")
+                 logger.debug("GnomeRecastWindow: show_transcript_view called without item. Navigating to transcript view.")
             self._set_active_view("transcript")
             return
 
-        if hasattr(self, 'transcript_view') and self.transcript_view:
-            print(f"GnomeRecastWindow: Loading transcript {transcript_item.uuid} into view.")
-            self.transcript_view.load_transcript(transcript_item)
-            print(f"GnomeRecastWindow: Setting visible child to transcript_view.")
-            self._set_active_view("transcript")
-        else:
-            print("Error in show_transcript_view: TranscriptView not initialized or accessible.")
+        logger.debug("GnomeRecastWindow: Loading transcript %s into view.", transcript_item.uuid)
+        self.transcript_view.load_transcript(transcript_item)
+        logger.debug("GnomeRecastWindow: Setting visible child to transcript_view.")
+        self._set_active_view("transcript")
 
 
     def show_initial_view(self, button=None):
             """
             Switches the main view back to the initial view and resets relevant state.
             """
-            print("GnomeRecastWindow: Switching back to initial view.")
-            if hasattr(self, 'transcript_view') and self.transcript_view:
-                if hasattr(self.transcript_view, 'player_controls') and self.transcript_view.player_controls:
-                    if hasattr(self.transcript_view.player_controls, 'player') and self.transcript_view.player_controls.player:
-                        print("GnomeRecastWindow: Stopping media player in transcript view.")
-                        self.transcript_view.player_controls.player.stop()
-                else:
-                    print("GnomeRecastWindow: TranscriptView has no player_controls attribute.")
-            else:
-                print("GnomeRecastWindow: TranscriptView not found, cannot stop player.")
-
+            logger.debug("GnomeRecastWindow: Switching back to initial view.")
+            player = getattr(getattr(self._transcript_view, 'player_controls', None), 'player', None)
+            if player:
+                logger.debug("GnomeRecastWindow: Stopping media player in transcript view.")
+                player.stop()
 
             self._set_active_view("initial")
 
+    def _reset_to_initial_view(self):
+        """Idle callback: resets the record button, then switches back to the initial view."""
+        self.initial_view.reset_button_state()
+        self.show_initial_view()
+        return GLib.SOURCE_REMOVE
+
     def show_history_view(self, button=None):
         """Switches the main view to the history view."""
-        print("GnomeRecastWindow: Switching to history view.")
+        logger.debug("GnomeRecastWindow: Switching to history view.")
+        self._ensure_deferred_built()
         self._set_active_view("history")
-        if hasattr(self, 'reader_button'):
-            self.reader_button.set_sensitive(False)
-        self._selected_history_transcript = None
+        self.reader_button.set_sensitive(False)
+        self._set_selected_history_transcript(None)
 
 
     def start_recording_ui(self, *args):
@@ -322,20 +578,27 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
         if self.is_recording:
             return
 
-        print("GnomeRecastWindow: Starting recording UI.")
+        logger.debug("GnomeRecastWindow: Starting recording UI.")
         self.is_recording = True
 
-        print("GnomeRecastWindow: Starting audio capture.")
-        self.recording_audio_buffer.clear()
+        logger.debug("GnomeRecastWindow: Starting audio capture.")
+        try:
+            self._open_recording_wav()
+        except OSError as e:
+            logger.error("GnomeRecastWindow: Error creating recording file: %s", e)
+            ToastPresenter.show(self, f"❌ Could not create recording file: {e}")
+            self.stop_recording_ui()
+            return
         try:
             self.recording_audio_capturer = AudioCapturer(
                 settings=self.settings,
                 data_callback=self._on_recording_audio_data
             )
             self.recording_audio_capturer.start()
-            print("GnomeRecastWindow: AudioCapturer started.")
+            logger.debug("GnomeRecastWindow: AudioCapturer started.")
         except Exception as e:
-            print(f"GnomeRecastWindow: Error starting AudioCapturer: {e}")
+            logger.error("GnomeRecastWindow: Error starting AudioCapturer: %s", e)
+            self._discard_recording(self._close_recording_wav())
             self.stop_recording_ui()
             return
 
@@ -344,11 +607,13 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
         self.recording_controls_box.set_visible(True)
 
         self.recording_timer_label.set_text("00:00")
+        self._last_shown_seconds = 0
         self.recording_start_time = GLib.get_monotonic_time()
         if self.recording_timer_id:
                 GLib.source_remove(self.recording_timer_id)
-        self.recording_timer_id = GLib.timeout_add_seconds(1, self._update_recording_timer)
-        print("GnomeRecastWindow: Recording UI started.")
+        # Sub-second ticks keep the label from skipping a second; it is only redrawn on change.
+        self.recording_timer_id = GLib.timeout_add(250, self._update_recording_timer)
+        logger.debug("GnomeRecastWindow: Recording UI started.")
 
 
     def stop_recording_ui(self):
@@ -356,100 +621,123 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
         if not self.is_recording:
             return
 
-        print("GnomeRecastWindow: Stopping recording UI.")
+        logger.debug("GnomeRecastWindow: Stopping recording UI.")
         self.is_recording = False
 
         if self.recording_timer_id:
             GLib.source_remove(self.recording_timer_id)
             self.recording_timer_id = None
-            print("GnomeRecastWindow: Recording timer stopped.")
+            logger.debug("GnomeRecastWindow: Recording timer stopped.")
 
         self.recording_controls_box.set_visible(False)
         self.header_bar.set_title_widget(self.window_title_widget)
         self.window_title_widget.set_visible(True)
-        print("GnomeRecastWindow: Recording UI stopped.")
-        if hasattr(self, 'initial_view') and self.initial_view:
-             self.initial_view.reset_button_state()
+        logger.debug("GnomeRecastWindow: Recording UI stopped.")
+        self.initial_view.reset_button_state()
 
 
     def _update_recording_timer(self):
-        """Updates the recording timer label every second."""
+        """Updates the recording timer label when the elapsed whole seconds change."""
         if not self.is_recording or self.recording_start_time is None:
-            print("GnomeRecastWindow: Timer update called but not recording. Stopping timer.")
+            logger.debug("GnomeRecastWindow: Timer update called but not recording. Stopping timer.")
             self.recording_timer_id = None
             return GLib.SOURCE_REMOVE
 
         now = GLib.get_monotonic_time()
         elapsed_us = now - self.recording_start_time
-        elapsed_s = int(elapsed_us // 1_000_000)
+        elapsed_s = elapsed_us // 1_000_000
+        if elapsed_s == self._last_shown_seconds or not self._timer_label_on_screen():
+            return GLib.SOURCE_CONTINUE
+        self._last_shown_seconds = elapsed_s
 
-        minutes = elapsed_s // 60
-        seconds = elapsed_s % 60
-        time_str = f"{str(minutes).zfill(2)}:{str(seconds).zfill(2)}"
-        self.recording_timer_label.set_text(time_str)
+        minutes, seconds = divmod(elapsed_s, 60)
+        minutes_str = _TWO_DIGITS[minutes] if minutes < 100 else str(minutes)
+        self.recording_timer_label.set_text(f"{minutes_str}:{_TWO_DIGITS[seconds]}")
 
         return GLib.SOURCE_CONTINUE
 
 
+    def _timer_label_on_screen(self) -> bool:
+        """False while the window is hidden or minimized; the label catches up on the next tick."""
+        if not self.is_visible():
+            return False
+        surface = self.get_surface()
+        return surface is None or not (surface.get_state() & Gdk.ToplevelState.MINIMIZED)
+
     def _on_stop_recording_clicked(self, *args):
         """Handles the stop-recording signal or button click."""
-        print("GnomeRecastWindow: Stop recording button clicked.")
+        logger.debug("GnomeRecastWindow: Stop recording button clicked.")
 
         if self.recording_audio_capturer:
-            print("GnomeRecastWindow: Stopping audio capture.")
+            logger.debug("GnomeRecastWindow: Stopping audio capture.")
             self.recording_audio_capturer.stop()
             # Ensure cleanup is called, potentially on idle_add if it involves GLib operations
             GLib.idle_add(self.recording_audio_capturer.cleanup_on_destroy)
             self.recording_audio_capturer = None
-            print("GnomeRecastWindow: AudioCapturer stopped and cleanup scheduled.")
+            logger.debug("GnomeRecastWindow: AudioCapturer stopped and cleanup scheduled.")
         else:
-            print("GnomeRecastWindow: No active audio capturer found to stop.")
+            logger.debug("GnomeRecastWindow: No active audio capturer found to stop.")
 
+        # Chunks arriving after this point find no writer and are dropped.
+        recorded_nbytes = self.recording_audio_nbytes
+        recording = self._detach_recording_wav()
         self.stop_recording_ui()
 
-        if self.recording_audio_buffer:
-            print(f"GnomeRecastWindow: Saving recorded audio buffer ({len(self.recording_audio_buffer)} bytes).")
-            try:
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                    temp_wav_path = temp_file.name
-
-                print(f"GnomeRecastWindow: Writing to temporary WAV file: {temp_wav_path}")
-                with wave.open(temp_wav_path, 'wb') as wf:
-                    wf.setnchannels(1)
-                    wf.setsampwidth(2)
-                    wf.setframerate(16000)
-                    wf.writeframes(self.recording_audio_buffer)
-
-                self._start_transcription_process([temp_wav_path])
-            except Exception as e:
-                print(f"GnomeRecastWindow: Error saving recording to WAV file: {e}")
-
-            finally:
-                self.recording_audio_buffer.clear()
-                print("GnomeRecastWindow: Audio buffer cleared.")
+        if recording is None:
+            logger.debug("GnomeRecastWindow: No recording file to finish.")
+            return
+        # The final flush and header patch happen off the main loop.
+        if self._io_pool is not None:
+            self._io_pool.submit(self._finish_recording, recording, recorded_nbytes)
         else:
-            print("GnomeRecastWindow: No audio recorded.")
+            logger.warning("GnomeRecastWindow: I/O thread pool not available, finishing WAV on the main thread.")
+            self._finish_recording(recording, recorded_nbytes)
+
+    def _finish_recording(self, recording: tuple, recorded_nbytes: int):
+        """Closes the recorded WAV file, then starts transcription on the main loop."""
+        wav_path = self._finalize_recording_wav(recording)
+        if wav_path and recorded_nbytes:
+            logger.debug("GnomeRecastWindow: Recorded %s bytes to %s.", recorded_nbytes, wav_path)
+            # The WAV is deleted once it has been transcribed.
+            GLib.idle_add(functools.partial(self._start_transcription_process, [wav_path], cleanup_paths=(wav_path,)))
+        else:
+            logger.debug("GnomeRecastWindow: No audio recorded.")
+            self._discard_recording(wav_path)
+
+    def _discard_recording(self, wav_path: Optional[str]):
+        """Removes a recording file that will not be transcribed."""
+        if wav_path:
+            try:
+                os.remove(wav_path)
+            except OSError as e:
+                logger.warning("GnomeRecastWindow: Could not remove recording %s: %s", wav_path, e)
 
     def on_segment_generated(self, segment_dict: dict):
-        """Handles a single segment generated by the transcriber."""
-        print(f"Window: Received segment [{segment_dict.get('start', '?'):.2f}s->{segment_dict.get('end', '?'):.2f}s], scheduling UI update.")
-        if 'start' in segment_dict and 'start_ms' not in segment_dict:
-            segment_dict["start_ms"] = int(float(segment_dict["start"]) * 1000)
-        if 'end' in segment_dict and 'end_ms' not in segment_dict:
-            segment_dict["end_ms"] = int(float(segment_dict["end"]) * 1000)
-
-        GLib.idle_add(self._idle_add_segment_callback, segment_dict)
-
-    def _idle_add_segment_callback(self, segment_dict):
-        """Helper function called by GLib.idle_add to add a segment with debugging."""
-        print(f"Window (idle_add): Calling add_segment for [{segment_dict.get('start', '?'):.2f}s->{segment_dict.get('end', '?'):.2f}s].")
-        if hasattr(self, 'transcript_view') and self.transcript_view:
-            self.transcript_view.add_segment(segment_dict)
-        else:
-            print("Window (idle_add): Error - TranscriptView not found when trying to add segment.")
+        """
+        Handles a single segment generated by the transcriber. Runs on the
+        transcription thread; the dict already carries start_ms/end_ms.
+        """
+        # Segments arriving in a burst share a single idle flush.
+        with self._pending_segments_lock:
+            self._pending_segments.append(segment_dict)
+            if self._segment_flush_scheduled:
+                return
+            self._segment_flush_scheduled = True
+        GLib.idle_add(self._flush_segments)
+
+    def _flush_segments(self):
+        """Idle handler that adds every pending segment to the transcript view in one batch."""
+        with self._pending_segments_lock:
+            batch = self._pending_segments
+            self._pending_segments = collections.deque()
+            self._segment_flush_scheduled = False
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Window (idle_add): Adding %d pending segment(s).", len(batch))
+        self.transcript_view.add_segments(list(batch))
         return GLib.SOURCE_REMOVE
 
-    def _start_transcription_process(self, file_paths: list, cleanup_paths: list | None = None):
+    def _start_transcription_process(self, file_paths: list, cleanup_paths: tuple[str, ...] = ()):
         """
         Starts the transcription process for the given file paths, integrating progress
         and results directly into TranscriptionView. Optionally cleans up specified
@@ -457,304 +745,330 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
 
         Args:
             file_paths: A list of absolute paths to audio/video files.
-            cleanup_paths: An optional list of absolute paths to files that should be
-                            deleted after successful transcription.
+            cleanup_paths: Absolute paths to files that should be deleted after
+                            successful transcription. Empty by default.
         """
         if not file_paths:
-            print("GnomeRecastWindow: No file paths provided for transcription.")
+            logger.warning("GnomeRecastWindow: No file paths provided for transcription.")
             return
 
         self.transcript_view.reset_view()
 
         GLib.idle_add(self._set_active_view, "transcript")
 
-        def on_progress(fraction: float, total_segments: int = 0, completed_segments: int = 0):
-            """Callback for transcription progress updates."""
-            GLib.idle_add(self.transcript_view.update_progress, fraction, total_segments, completed_segments)
-
-        # Updated on_completion to handle new parameters from transcriber
-        def on_completion(status: str, transcript_segments: list, saved_json_path: Optional[str], save_error_message: Optional[str]):
-            """Handles transcription completion, cleanup, and final state, including save status."""
-            print(f"GnomeRecastWindow: Transcription process finished. Status: {status}, Saved JSON: {saved_json_path}, Save Error: {save_error_message}")
-
-            # Determine primary success based on transcription itself
-            transcription_successful = status == 'completed' or status == 'completed_save_failed'
-
-            if cleanup_paths and transcription_successful: # Cleanup if transcription part was okay
-                print(f"GnomeRecastWindow: Transcription part successful. Attempting cleanup for: {cleanup_paths}")
-                for path in cleanup_paths:
-                    try:
-                        if os.path.exists(path):
-                            os.remove(path)
-                            print(f"GnomeRecastWindow: Successfully removed temporary file: {path}")
-                        else:
-                            print(f"GnomeRecastWindow: Temporary file not found for cleanup: {path}")
-                    except OSError as e:
-                        print(f"GnomeRecastWindow: Error removing temporary file {path}: {e}")
-            elif cleanup_paths:
-                print(f"GnomeRecastWindow: Transcription status was '{status}'. Skipping cleanup for: {cleanup_paths}")
-
-            if status == 'completed': # Transcription and save successful
-                toast_message = f"Saved ✓ {os.path.basename(saved_json_path)}" if saved_json_path else "Transcription complete, save path unknown."
-                ToastPresenter.show(self, toast_message)
-                GLib.idle_add(self.history_view.refresh_list)
-                print(f"GnomeRecastWindow: Transcription and save successful. Segments added in real-time. History refreshed.")
-            elif status == 'completed_save_failed':
-                base_filename = os.path.basename(cleanup_paths[0]) if cleanup_paths else "transcript" # Get a filename for the toast
-                toast_message = f"❌ Could not save {base_filename}: {save_error_message or 'Unknown error'}"
-                ToastPresenter.show(self, toast_message)
-                # Transcription itself was okay, segments might be in view, but not persisted.
-                # Decide if history should be refreshed if a .tmp file might exist or if it's an overwrite fail.
-                # For now, let's not refresh history if save failed, to avoid showing a non-existent item.
-                print(f"GnomeRecastWindow: Transcription successful, but save failed. Segments might be in view.")
-            elif status == 'error':
-                toast_message = f"❌ Transcription failed: {save_error_message or 'Unknown error'}"
-                ToastPresenter.show(self, toast_message)
-                print(f"GnomeRecastWindow: Transcription failed. Error: {save_error_message}")
-                if hasattr(self, 'initial_view') and self.initial_view:
-                    GLib.idle_add(self.initial_view.reset_button_state)
-                GLib.idle_add(self.show_initial_view)
-            elif status == 'cancelled':
-                ToastPresenter.show(self, "Transcription cancelled.")
-                print(f"GnomeRecastWindow: Transcription cancelled by user.")
-                # Optionally, revert to initial view or leave as is
-                if hasattr(self, 'initial_view') and self.initial_view:
-                    GLib.idle_add(self.initial_view.reset_button_state)
-                GLib.idle_add(self.show_initial_view) # Or stay on transcript view if partially filled
-            elif status == 'no_files':
-                ToastPresenter.show(self, "No files selected for transcription.")
-            else: # Other unexpected statuses
-                ToastPresenter.show(self, f"Transcription finished with status: {status}")
-                if hasattr(self, 'initial_view') and self.initial_view:
-                    GLib.idle_add(self.initial_view.reset_button_state)
-                GLib.idle_add(self.show_initial_view)
-
-
         self.transcriber.start_transcription(
             file_paths=file_paths,
-            progress_callback=on_progress,
+            progress_callback=self._on_transcription_progress,
             segment_callback=self.on_segment_generated,
-            completion_callback=on_completion
+            completion_callback=functools.partial(self._on_transcription_completed, cleanup_paths=cleanup_paths)
         )
-        print(f"GnomeRecastWindow: Transcription started for {file_paths}")
-
+        logger.debug("GnomeRecastWindow: Transcription started for %s", file_paths)
+
+    def _on_transcription_progress(self, fraction: float, total_segments: int = 0, completed_segments: int = 0):
+        """Callback for transcription progress updates; the transcriber already delivers it on the main loop."""
+        self.transcript_view.update_progress(fraction, total_segments, completed_segments)
+
+    # Updated on_completion to handle new parameters from transcriber
+    def _on_transcription_completed(self, status: str, transcript_segments: list, saved_json_path: Optional[str],
+                                    save_error_message: Optional[str], cleanup_paths: tuple[str, ...] = ()):
+        """Handles transcription completion, cleanup, and final state, including save status."""
+        logger.debug("GnomeRecastWindow: Transcription process finished. Status: %s, Saved JSON: %s, Save Error: %s", status, saved_json_path, save_error_message)
+
+        # Determine primary success based on transcription itself
+        transcription_successful = status == 'completed' or status == 'completed_save_failed'
+
+        if cleanup_paths and transcription_successful: # Cleanup if transcription part was okay
+            logger.debug("GnomeRecastWindow: Transcription part successful. Attempting cleanup for: %s", cleanup_paths)
+            path_exists, remove = os.path.exists, os.remove
+            for path in cleanup_paths:
+                try:
+                    if path_exists(path):
+                        remove(path)
+                        logger.debug("GnomeRecastWindow: Successfully removed temporary file: %s", path)
+                    else:
+                        logger.debug("GnomeRecastWindow: Temporary file not found for cleanup: %s", path)
+                except OSError as e:
+                    logger.error("GnomeRecastWindow: Error removing temporary file %s: %s", path, e)
+        elif cleanup_paths:
+            logger.debug("GnomeRecastWindow: Transcription status was '%s'. Skipping cleanup for: %s", status, cleanup_paths)
+
+        if status == 'completed': # Transcription and save successful
+            if saved_json_path:
+                ToastPresenter.show_template(self, "Saved ✓ {0}", os.path.basename(saved_json_path))
+            else:
+                ToastPresenter.show(self, "Transcription complete, save path unknown.")
+            GLib.idle_add(self._refresh_history_list)
+            logger.debug("GnomeRecastWindow: Transcription and save successful. Segments added in real-time. History refreshed.")
+        elif status == 'completed_save_failed':
+            base_filename = os.path.basename(cleanup_paths[0]) if cleanup_paths else "transcript" # Get a filename for the toast
+            ToastPresenter.show_template(self, "❌ Could not save {0}: {1}", base_filename, save_error_message or 'Unknown error')
+            # Transcription itself was okay, segments might be in view, but not persisted.
+            # Decide if history should be refreshed if a .tmp file might exist or if it's an overwrite fail.
+            # For now, let's not refresh history if save failed, to avoid showing a non-existent item.
+            logger.warning("GnomeRecastWindow: Transcription successful, but save failed. Segments might be in view.")
+        elif status == 'error':
+            ToastPresenter.show_template(self, "❌ Transcription failed: {0}", save_error_message or 'Unknown error')
+            logger.error("GnomeRecastWindow: Transcription failed. Error: %s", save_error_message)
+            GLib.idle_add(self._reset_to_initial_view)
+        elif status == 'cancelled':
+            ToastPresenter.show(self, "Transcription cancelled.")
+            logger.debug("GnomeRecastWindow: Transcription cancelled by user.")
+            # Optionally, revert to initial view or leave as is
+            GLib.idle_add(self._reset_to_initial_view) # Or stay on transcript view if partially filled
+        elif status == 'no_files':
+            ToastPresenter.show(self, "No files selected for transcription.")
+        else: # Other unexpected statuses
+            ToastPresenter.show_template(self, "Transcription finished with status: {0}", status)
+            GLib.idle_add(self._reset_to_initial_view)
 
     def _on_file_drop(self, drop_target, value, x, y):
         """Handles the 'drop' signal from the main view stack's drop target."""
-        print(f"GnomeRecastWindow: Drop detected. Value type: {type(value)}")
+        logger.debug("GnomeRecastWindow: Drop detected. Value type: %s", type(value))
         if isinstance(value, Gio.File):
             file_path = value.get_path()
             if file_path:
-                print(f"GnomeRecastWindow: File dropped: {file_path}")
-                if os.path.exists(file_path) and os.path.isfile(file_path):
-                    if file_path.lower().endswith(".json"):
-                        print(f"Attempting to import (drag & drop) JSON transcript: {file_path}")
+                logger.debug("GnomeRecastWindow: File dropped: %s", file_path)
+                try:
+                    is_regular_file = stat.S_ISREG(os.stat(file_path).st_mode)
+                except OSError:
+                    is_regular_file = False
+                if is_regular_file:
+                    if os.path.splitext(file_path)[1].lower() == ".json":
+                        logger.debug("Attempting to import (drag & drop) JSON transcript: %s", file_path)
                         self._import_transcript_file(file_path) # Use the new import handler
                     else:
                         # Assume it's an audio/video file for transcription
-                        print(f"Attempting to transcribe (drag & drop) media file: {file_path}")
-                        self.transcript_view.reset_view()
-                        self._set_active_view("transcript")
-                        self._start_transcription_process([file_path], cleanup_paths=[])
+                        logger.debug("Attempting to transcribe (drag & drop) media file: %s", file_path)
+                        # _start_transcription_process resets the view and switches to it.
+                        self._start_transcription_process([file_path])
                     return True
                 else:
-                    print(f"GnomeRecastWindow: Dropped path is not a valid file: {file_path}")
+                    logger.warning("GnomeRecastWindow: Dropped path is not a valid file: %s", file_path)
                     return False
             else:
-                print("GnomeRecastWindow: Dropped Gio.File has no path.")
+                logger.debug("GnomeRecastWindow: Dropped Gio.File has no path.")
                 return False
         elif isinstance(value, Gtk.StringObject):
                 text = value.get_string()
-                print(f"GnomeRecastWindow: Text dropped (ignored): {text[:50]}...")
+                logger.debug("GnomeRecastWindow: Text dropped (ignored): %s...", text[:50])
                 return False
         else:
-            print(f"GnomeRecastWindow: Unsupported drop value type: {type(value)}")
+            logger.warning("GnomeRecastWindow: Unsupported drop value type: %s", type(value))
             return False
 
     def _create_mode_action(self):
         """Creates and adds a stateful action for mode selection."""
+        self._mode_state_key = self._get_current_mode_key()
         action = Gio.SimpleAction.new_stateful(
-            "select-mode", GLib.VariantType.new('s'), GLib.Variant.new_string(self._get_current_mode_key())
+            "select-mode", _STRING_VARIANT_TYPE, _string_variant(self._mode_state_key)
         )
         action.connect("change-state", self._on_select_mode)
+        self._mode_action = action
         self.add_action(action)
-        print("Action 'win.select-mode' created.")
+        logger.debug("Action 'win.select-mode' created.")
 
     def _create_language_action(self):
         """Creates and adds a stateful action for language selection."""
+        self._language_state_key = self._get_current_language_key()
         action = Gio.SimpleAction.new_stateful(
-            "select-language", GLib.VariantType.new('s'), GLib.Variant.new_string(self._get_current_language_key())
+            "select-language", _STRING_VARIANT_TYPE, _string_variant(self._language_state_key)
         )
         action.connect("change-state", self._on_select_language)
+        self._language_action = action
         self.add_action(action)
-        print("Action 'win.select-language' created.")
+        logger.debug("Action 'win.select-language' created.")
 
-    def _create_export_action(self):
-        """Creates and adds a simple action for exporting the transcript."""
-        action = Gio.SimpleAction.new("export-transcript", None)
-        action.connect("activate", self._on_export_transcript)
-        action.set_enabled(False) # Initially disabled, enabled when transcript view is active
-        self.add_action(action)
-        print("Action 'win.export-transcript' created.")
-
-    def _create_save_action(self):
-        """Creates and adds a simple action for saving the current transcript."""
-        action = Gio.SimpleAction.new("save-transcript", None)
-        action.connect("activate", self._on_save_transcript)
-        # Sensitivity will be managed based on transcript_view content
-        # For now, let's assume it's enabled if transcript_view has content.
-        # This will be checked in _on_save_transcript or by a separate update method.
-        action.set_enabled(False) # Start disabled, enable when content is available
-        self.add_action(action)
+    def _create_simple_actions(self):
+        """Creates and adds the stateless window actions listed in _SIMPLE_ACTIONS."""
         # Accelerators for window actions are set on the application
-        app = self.get_application()
-        if app:
-            app.set_accels_for_action("win.save-transcript", ["<Control>s"])
-        print("Action 'win.save-transcript' (Ctrl+S) created.")
-
-    def _create_open_action(self):
-        """Creates and adds a simple action for opening a transcript or media file."""
-        action = Gio.SimpleAction.new("open-file", None)
-        action.connect("activate", self._on_open_file_activate)
-        self.add_action(action)
-        app = self.get_application()
-        if app:
-            # Using "win.open-file" to be consistent with other window actions if it's window-specific.
-            # If it's a global app action that could be triggered without the window, "app.open-file" is fine.
-            # Let's assume it's tied to this window's context for now.
-            app.set_accels_for_action("win.open-file", ["<Control>o"])
-        print("Action 'win.open-file' (Ctrl+O) created.")
+        app = self._app
+        for name, handler_name, enabled, accels, attr_name in _SIMPLE_ACTIONS:
+            action = Gio.SimpleAction.new(name, None)
+            action.connect("activate", getattr(self, handler_name))
+            action.set_enabled(enabled)
+            self.add_action(action)
+            if attr_name:
+                setattr(self, attr_name, action)
+            if app and accels:
+                app.set_accels_for_action(f"win.{name}", list(accels))
+            logger.debug("Action 'win.%s' created.", name)
 
 
     def _on_history_item_selected(self, history_view, transcript_item):
         """Updates UI when a transcript item is selected in history view."""
-        print(f"Transcript selected: {transcript_item.output_filename}")
+        logger.debug("Transcript selected: %s", transcript_item.output_filename)
+        self._set_selected_history_transcript(transcript_item)
+        # Enable reader button only if the selected item has segments
+        self.reader_button.set_sensitive(bool(self._selected_history_segments))
+
+    def _set_selected_history_transcript(self, transcript_item: Optional[TranscriptItem]):
+        """Tracks the history selection and partitions its segments once for the hot loops."""
         self._selected_history_transcript = transcript_item
-        if hasattr(self, 'reader_button'):
-            # Enable reader button only if the selected item has segments
-            self.reader_button.set_sensitive(bool(transcript_item and transcript_item.segments))
+        if transcript_item and transcript_item.segments:
+            seg_cls = SegmentItem # Local name: avoids a global lookup per segment
+            self._selected_history_segments = [s for s in transcript_item.segments if isinstance(s, seg_cls)]
+        else:
+            self._selected_history_segments = []
 
     def _on_select_mode(self, action, value):
         """Handles state change for the mode selection action."""
         new_mode_key = value.get_string()
-        print(f"Changing mode to: {new_mode_key}")
+        logger.debug("Changing mode to: %s", new_mode_key)
 
-        if new_mode_key in MODE_TO_MODEL:
-            new_model_size = MODE_TO_MODEL[new_mode_key]
+        new_model_size = MODE_TO_MODEL.get(new_mode_key) # One lookup validates and maps the key
+        if new_model_size is not None:
+            self._cached_model = new_model_size
+            self._cached_mode_key = new_mode_key
             self.settings.set_string("default-model", new_model_size)
             action.set_state(value)
+            self._mode_state_key = new_mode_key
         else:
-            print(f"Warning: Unknown mode key selected: {new_mode_key}")
+            logger.warning("Unknown mode key selected: %s", new_mode_key)
 
     def _on_select_language(self, action, value):
         """Handles state change for the language selection action."""
         new_lang_key = value.get_string()
-        print(f"Changing language to: {new_lang_key}")
+        logger.debug("Changing language to: %s", new_lang_key)
 
         if new_lang_key == "auto":
+            self._cached_autodetect = True
             self.settings.set_boolean("auto-detect-language", True)
         elif new_lang_key in LANGUAGE_MAP:
+            self._cached_autodetect = False
+            self._cached_lang = new_lang_key
             self.settings.set_boolean("auto-detect-language", False)
             self.settings.set_string("target-language", new_lang_key)
         else:
-            print(f"Warning: Unknown language key selected: {new_lang_key}")
+            logger.warning("Unknown language key selected: %s", new_lang_key)
             return
 
         action.set_state(value)
+        self._language_state_key = new_lang_key
 
 
     def _get_current_mode_key(self) -> str:
-        """Gets the current mode key based on GSettings."""
-        current_model = self.settings.get_string("default-model")
-        return MODEL_TO_MODE.get(current_model, "balanced")
+        """Gets the current mode key, derived once per default-model change."""
+        return self._cached_mode_key
 
     def _get_current_language_key(self) -> str:
-        """Gets the current language key based on GSettings."""
-        if self.settings.get_boolean("auto-detect-language"):
+        """Gets the current language key from the cached GSettings values."""
+        if self._cached_autodetect:
             return "auto"
         else:
-            return self.settings.get_string("target-language")
+            return self._cached_lang
 
     def _update_mode_button_label(self):
         """Updates the mode button label based on the current GSettings."""
         current_mode_key = self._get_current_mode_key()
         label = MODE_MAP.get(current_mode_key, "Unknown Mode")
-        self.mode_button.set_label(label)
-        mode_action = self.lookup_action("select-mode")
-        if mode_action and mode_action.get_state().get_string() != current_mode_key:
-                mode_action.set_state(GLib.Variant.new_string(current_mode_key))
-        print(f"Mode button label updated to: {label}")
+        if self.mode_button.get_label() != label:
+            self.mode_button.set_label(label)
+        if self._mode_action and self._mode_state_key != current_mode_key:
+            self._mode_action.set_state(_string_variant(current_mode_key))
+            self._mode_state_key = current_mode_key
+        logger.debug("Mode button label updated to: %s", label)
 
     def _update_language_button_label(self):
         """Updates the language button label based on the current GSettings."""
         current_lang_key = self._get_current_language_key()
         label = LANGUAGE_MAP.get(current_lang_key, "Unknown Lang")
-        self.language_button.set_label(label)
-        lang_action = self.lookup_action("select-language")
-        if lang_action and lang_action.get_state().get_string() != current_lang_key:
-                lang_action.set_state(GLib.Variant.new_string(current_lang_key))
-        print(f"Language button label updated to: {label}")
+        if self.language_button.get_label() != label:
+            self.language_button.set_label(label)
+        if self._language_action and self._language_state_key != current_lang_key:
+            self._language_action.set_state(_string_variant(current_lang_key))
+            self._language_state_key = current_lang_key
+        logger.debug("Language button label updated to: %s", label)
+
+
+    def _get_export_filters(self) -> tuple[Gio.ListStore, dict[str, Gtk.FileFilter]]:
+        """Returns the export dialog filters and the same filters keyed by name."""
+        if self._export_filters is None:
+            filters = Gio.ListStore.new(Gtk.FileFilter)
+            filters_by_name = {}
+            for name, (_, ext) in _FILTER_NAME_TO_FORMAT.items():
+                file_filter = Gtk.FileFilter()
+                file_filter.set_name(name)
+                file_filter.add_pattern(f"*{ext}")
+                filters.append(file_filter)
+                filters_by_name[name] = file_filter
+            self._export_filters = (filters, filters_by_name)
+        return self._export_filters
+
+    def _get_open_filters(self) -> tuple[Gio.ListStore, Gtk.FileFilter]:
+        """Returns the open dialog filters and the combined 'All Supported Files' filter."""
+        if self._open_filters is None:
+            json_filter = Gtk.FileFilter()
+            json_filter.set_name("Transcript Files (*.json)")
+            json_filter.add_mime_type("application/json")
+            json_filter.add_pattern("*.json")
 
+            # Common audio formats (extend as needed)
+            audio_video_filter = Gtk.FileFilter()
+            audio_video_filter.set_name("Audio/Video Files")
+            # General types
+            audio_video_filter.add_mime_type("audio/*")
+            audio_video_filter.add_mime_type("video/*")
+            # Specific common patterns (examples)
+            for pattern in ("*.mp3", "*.wav", "*.ogg", "*.flac", "*.mp4", "*.mkv", "*.mov", "*.webm"):
+                audio_video_filter.add_pattern(pattern)
+
+            all_supported_filter = Gtk.FileFilter()
+            all_supported_filter.set_name("All Supported Files")
+            all_supported_filter.add_filter(json_filter)
+            all_supported_filter.add_filter(audio_video_filter)
+
+            filters = Gio.ListStore.new(Gtk.FileFilter)
+            filters.append(all_supported_filter) # Add combined filter first
+            filters.append(json_filter)
+            filters.append(audio_video_filter)
+            self._open_filters = (filters, all_supported_filter)
+        return self._open_filters
+
+    def _get_save_filters(self) -> tuple[Gio.ListStore, Gtk.FileFilter]:
+        """Returns the Save As dialog filters and its single JSON filter."""
+        if self._save_filters is None:
+            json_filter = Gtk.FileFilter()
+            json_filter.set_name("JSON Transcript Files (*.json)")
+            json_filter.add_mime_type("application/json")
+            json_filter.add_pattern("*.json")
+
+            filters = Gio.ListStore.new(Gtk.FileFilter)
+            filters.append(json_filter)
+            self._save_filters = (filters, json_filter)
+        return self._save_filters
 
     def _on_export_transcript(self, action, param):
         """Handles the 'activate' signal for the 'export-transcript' action."""
-        print("Export Transcript action activated.")
+        logger.debug("Export Transcript action activated.")
 
-        if not (hasattr(self, 'transcript_view') and self.transcript_view and
-                hasattr(self.transcript_view, 'has_content') and self.transcript_view.has_content()):
+        if not self.transcript_view.has_content():
             ToastPresenter.show(self, "Nothing to export.")
-            print("Export action: No active transcript content to export.")
+            logger.debug("Export action: No active transcript content to export.")
             return
 
         current_item = self.transcript_view.get_current_item()
         if not current_item:
-            # Fallback: try to construct a temporary item from view data if no item is formally loaded
+            # Fallback: export the view content without a formally loaded item.
             # This case should be less common if transcription/load always sets current_item.
-            # For now, we require a current_item to get metadata like output_filename_base.
-             view_data = self.transcript_view.get_transcript_data_for_saving()
-             if not view_data or not view_data.get("segments"):
+            # Only the segment list is snapshotted here; the temporary TranscriptItem
+            # is built on the export worker, not before the dialog opens.
+            build_view_data = self.transcript_view.snapshot_transcript_data_for_saving()
+            if build_view_data is None:
                 ToastPresenter.show(self, "No transcript data available to export.")
                 return
-            # Create a temporary TranscriptItem for export if one isn't set.
-            # This is a simplified approach.
-             current_item = TranscriptItem(
-                source_path="", # No source path for an unsaved item
-                transcript_text=view_data.get("text", ""),
-                segments=[SegmentItem(**s) for s in view_data.get("segments", [])], # Reconstruct SegmentItem objects
-                language=view_data.get("language", "en")
-            )
-             current_item.output_filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_export"
+            current_item = _PendingExportItem(
+                build_view_data, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_export")
 
 
         dialog = Gtk.FileDialog.new()
         dialog.set_title("Export Transcript As...")
 
-        # Define file filters
-        filters = Gio.ListStore.new(Gtk.FileFilter)
-        
-        txt_filter = Gtk.FileFilter(); txt_filter.set_name("Plain Text (*.txt)"); txt_filter.add_pattern("*.txt")
-        filters.append(txt_filter)
-        
-        md_filter = Gtk.FileFilter(); md_filter.set_name("Markdown (*.md)"); md_filter.add_pattern("*.md")
-        filters.append(md_filter)
-        
-        srt_filter = Gtk.FileFilter(); srt_filter.set_name("SubRip Subtitle (*.srt)"); srt_filter.add_pattern("*.srt")
-        filters.append(srt_filter)
-        
-        json_filter = Gtk.FileFilter(); json_filter.set_name("JSON Transcript (*.json)"); json_filter.add_pattern("*.json")
-        filters.append(json_filter)
-        
+        filters, filters_by_name = self._get_export_filters()
         dialog.set_filters(filters)
 
-        # Pre-select last used filter
-        if self.last_export_filter_name:
-            for i in range(filters.get_n_items()):
-                f = filters.get_item(i)
-                if f.get_name() == self.last_export_filter_name:
-                    dialog.set_default_filter(f)
-                    break
-        else:
-            dialog.set_default_filter(txt_filter) # Default to TXT if no previous
+        # Pre-select last used filter, defaulting to TXT
+        dialog.set_default_filter(
+            filters_by_name.get(self.last_export_filter_name) or filters_by_name["Plain Text (*.txt)"])
 
         # Default filename
         base_name = os.path.splitext(current_item.output_filename)[0] if current_item.output_filename else "transcript"
@@ -763,7 +1077,7 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
         # We'll adjust it in the callback. For now, just set a base name.
         dialog.set_initial_name(base_name) # e.g., "YYYYMMDD_HHMMSS_new" or "transcript_export"
 
-        print("Showing file export dialog...")
+        logger.debug("Showing file export dialog...")
         dialog.save(self, None, self._on_export_dialog_finish, current_item)
 
 
@@ -786,150 +1100,197 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
                 # so checking the path is more reliable.
                 file_ext = os.path.splitext(target_path)[1].lower()
                 
-                export_format = None
-                if file_ext == ".txt":
-                    export_format = "txt"
-                elif file_ext == ".md":
-                    export_format = "md"
-                elif file_ext == ".srt":
-                    export_format = "srt"
-                elif file_ext == ".json":
-                    export_format = "json"
-                else:
-                    # Fallback if extension is missing or unknown, try to infer from filter name
-                    if self.last_export_filter_name:
-                        if "Plain Text" in self.last_export_filter_name: export_format = "txt"; target_path += ".txt"
-                        elif "Markdown" in self.last_export_filter_name: export_format = "md"; target_path += ".md"
-                        elif "SubRip" in self.last_export_filter_name: export_format = "srt"; target_path += ".srt"
-                        elif "JSON" in self.last_export_filter_name: export_format = "json"; target_path += ".json"
-                
+                export_format = _EXT_TO_FORMAT.get(file_ext)
+                if export_format is None:
+                    # Fallback if extension is missing or unknown, infer it from the filter
+                    fmt, ext = _FILTER_NAME_TO_FORMAT.get(self.last_export_filter_name, (None, None))
+                    if fmt:
+                        export_format = fmt
+                        target_path += ext
+
                 if not export_format:
                     ToastPresenter.show(self, "❌ Unknown export format. Please select a filter or use a known extension.")
                     return
 
-                print(f"Attempting to export transcript to: {target_path} as {export_format}")
+                logger.debug("Attempting to export transcript to: %s as %s", target_path, export_format)
 
-                app = self.get_application()
-                if not app or not hasattr(app, 'io_pool') or not app.io_pool:
+                if self._io_pool is None:
                     ToastPresenter.show(self, "❌ Export failed: Thread pool error.")
                     return
 
                 def export_io_operation():
                     try:
-                        content_to_write: Any = ""
-                        is_binary_write = False
-
-                        if export_format == "txt":
-                            content_to_write = export_utils.export_to_txt(transcript_item)
-                        elif export_format == "md":
-                            content_to_write = export_utils.export_to_md(transcript_item)
-                        elif export_format == "srt":
-                            content_to_write = export_utils.export_to_srt(transcript_item)
-                        elif export_format == "json":
-                            # Use the TranscriptItem's to_dict method for spec-compliant JSON
-                            content_to_write = transcript_item.to_dict()
-                            # atomic_write_json handles json.dump internally
-                            atomic_write_json(content_to_write, target_path)
+                        item = transcript_item
+                        if isinstance(item, _PendingExportItem):
+                            item = item.materialize()
+
+                        if export_format == "json":
+                            # Spec-compliant JSON (TranscriptItem.to_dict keys), streamed to disk
+                            # segment by segment and atomically replaced, all on this worker.
+                            export_utils.stream_export_json(item, target_path)
                             ToastPresenter.show(self, f"Exported ✓ {os.path.basename(target_path)}")
-                            return # atomic_write_json handles writing
+                            return
 
-                        # For text-based formats
-                        with open(target_path, "w", encoding='utf-8') as f:
-                            f.write(content_to_write)
-                        
-                        ToastPresenter.show(self, f"Exported ✓ {os.path.basename(target_path)}")
+                        # Text formats are rendered straight to UTF-8 (or taken from the
+                        # item's render cache) here, off the main loop; GIO then replaces
+                        # the file asynchronously from the main loop.
+                        data = GLib.Bytes.new(export_utils.render(item, export_format))
+                        GLib.idle_add(self._write_export_async, target_path, data)
 
                     except Exception as e_io:
-                        print(f"Error during export I/O to {target_path}: {e_io}")
+                        logger.error("Error during export I/O to %s: %s", target_path, e_io)
                         ToastPresenter.show(self, f"❌ Export failed: {e_io}")
                 
-                app.io_pool.submit(export_io_operation)
+                self._io_pool.submit(export_io_operation)
 
             else: # User cancelled
-                print("Export operation cancelled by user.")
+                logger.debug("Export operation cancelled by user.")
                 # No toast for cancellation typically
         except GLib.Error as e:
             if e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
-                print("Export operation cancelled by user (GLib.Error).")
+                logger.debug("Export operation cancelled by user (GLib.Error).")
             else:
-                print(f"GLib error during export dialog: {e}")
+                logger.error("GLib error during export dialog: %s", e)
                 ToastPresenter.show(self, f"❌ Export error: {e.code.value_nick}")
         except Exception as e_main:
-            print(f"Unexpected error during export dialog callback: {e_main}")
+            logger.error("Unexpected error during export dialog callback: %s", e_main, exc_info=True)
             ToastPresenter.show(self, f"❌ Unexpected export error.")
 
 
+    def _write_export_async(self, target_path: str, data: GLib.Bytes):
+        """Starts an asynchronous GIO replace of target_path with data. Runs on the main loop."""
+        gfile = Gio.File.new_for_path(target_path)
+        gfile.replace_contents_bytes_async(
+            data, None, False, Gio.FileCreateFlags.REPLACE_DESTINATION, None,
+            self._on_export_written, target_path
+        )
+        return GLib.SOURCE_REMOVE
+
+    def _on_export_written(self, gfile: Gio.File, result: Gio.AsyncResult, target_path: str):
+        """Completion callback for _write_export_async."""
+        try:
+            gfile.replace_contents_finish(result)
+            ToastPresenter.show(self, f"Exported ✓ {os.path.basename(target_path)}")
+        except GLib.Error as e:
+            logger.error("Error during export I/O to %s: %s", target_path, e.message)
+            ToastPresenter.show(self, f"❌ Export failed: {e.message}")
+
+
+    def _build_reader_window(self):
+        """Builds the Reader popup once; later opens only replace the buffer text."""
+        reader_window = Adw.ApplicationWindow(application=self._app)
+        reader_window.set_title("Reader Mode - Transcript")
+        reader_window.set_resizable(True)
+        reader_window.set_default_size(400, 600)
+        reader_window.set_modal(True)
+        reader_window.set_transient_for(self)
+        reader_window.add_css_class("reader-popup-window")
+        # Hide instead of destroying so the widget tree is reused on the next open.
+        reader_window.connect("close-request", self._on_reader_close_request)
+
+        top_bar_overlay = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
+        top_bar_overlay.add_css_class("topbar")
+        top_bar_overlay.set_valign(Gtk.Align.START)
+        top_bar_overlay.set_halign(Gtk.Align.END)
+        top_bar_overlay.set_margin_top(12)
+        top_bar_overlay.set_margin_end(12)
+
+        close_button = Gtk.Button(label="✕")
+        close_button.connect("clicked", lambda btn: reader_window.close())
+        top_bar_overlay.append(close_button)
+
+        buffer = Gtk.TextBuffer()
+
+        text_view = Gtk.TextView(buffer=buffer)
+        text_view.add_css_class("reader-text-view")
+        text_view.set_editable(False)
+        text_view.set_wrap_mode(Gtk.WrapMode.WORD)
+
+        scroller = Gtk.ScrolledWindow()
+        scroller.add_css_class("reader-scrolled-window")
+        scroller.set_child(text_view)
+        scroller.set_vexpand(True)
+        scroller.set_hexpand(True)
+
+        overlay = Gtk.Overlay()
+        overlay.set_child(scroller)
+        overlay.add_overlay(top_bar_overlay)
+
+        reader_window.set_content(overlay)
+        self._reader_window = reader_window
+        self._reader_buffer = buffer
+
+    @staticmethod
+    def _iter_reader_lines(segments):
+        """Yields the stripped, non-empty text of each segment for the Reader buffer."""
+        for seg in segments:
+            text = seg.text
+            if "→" in text:
+                # Safety net for segment text that itself carries [mm:ss → mm:ss] lines
+                # (e.g. pasted from an older reader export); cheap substring test first.
+                text = _TS_LINE_RE.sub("", text)
+            text = text.strip()
+            if text:
+                yield text
+
+    def _on_reader_close_request(self, reader_window):
+        reader_window.set_visible(False)
+        return True
+
     def _load_transcript_from_history(self, transcript_item: TranscriptItem):
         """
         Loads a TranscriptItem (selected from history) into the transcript view.
         Uses TranscriptView.load_transcript() directly.
         """
         if not transcript_item:
-            print("Error: _load_transcript_from_history (double-click handler) called with None item.")
-            if hasattr(self, 'reader_button'):
-                self.reader_button.set_sensitive(False)
-            self._selected_history_transcript = None
+            logger.error("Error: _load_transcript_from_history (double-click handler) called with None item.")
+            self.reader_button.set_sensitive(False)
+            self._set_selected_history_transcript(None)
             return
         
-        print(f"GnomeRecastWindow: _load_transcript_from_history called for item: {transcript_item.uuid if transcript_item else 'None'}")
-
-        self._selected_history_transcript = transcript_item # Keep track of selected item for Reader button etc.
-        if hasattr(self, 'reader_button'):
-            self.reader_button.set_sensitive(bool(transcript_item.segments)) # Enable reader if segments exist
-            print(f"Reader button sensitivity set for item {transcript_item.uuid}")
-
-        if not hasattr(self, 'transcript_view') or not self.transcript_view:
-            print("Error: TranscriptView not available to load history.")
-            return
+        logger.debug("GnomeRecastWindow: _load_transcript_from_history called for item: %s", transcript_item.uuid)
+
+        self._set_selected_history_transcript(transcript_item) # Keep track of selected item for Reader button etc.
+        self.reader_button.set_sensitive(bool(self._selected_history_segments)) # Enable reader if segments exist
+        logger.debug("Reader button sensitivity set for item %s", transcript_item.uuid)
+
+        logger.debug("GnomeRecastWindow: Queuing transcript load for history item %s", transcript_item.uuid)
+        # The per-segment display records are built on a worker thread; reset,
+        # batch-add and view switch then run in one idle callback.
+        from .views.transcript_view import build_segment_data
+        segments = self._selected_history_segments # Already filtered, and replaced (not mutated) on reselection
+
+        def build_segments():
+            segments_data = build_segment_data(segments)
+            GLib.idle_add(self._apply_history_transcript, transcript_item, segments_data)
+
+        threading.Thread(target=build_segments, daemon=True).start()
+        logger.debug("GnomeRecastWindow: _load_transcript_from_history completed for %s", transcript_item.uuid)
+
+    def _apply_history_transcript(self, transcript_item: TranscriptItem, segments_data: list):
+        """Idle callback: loads a history item into the transcript view and shows it."""
+        # load_transcript resets the view and adds all segments as a single batch.
+        self.transcript_view.load_transcript(transcript_item, segments_data)
+        self._set_active_view("transcript")
+        return GLib.SOURCE_REMOVE
 
-        print(f"GnomeRecastWindow: Queuing transcript_view.load_transcript for history item {transcript_item.uuid}")
-        # The load_transcript method in TranscriptView now handles resetting and adding segments.
-        GLib.idle_add(self.transcript_view.load_transcript, transcript_item)
-        # Ensure _set_active_view is also called via idle_add to run on the main thread after load_transcript might have started
-        GLib.idle_add(self._set_active_view, "transcript")
-        print(f"GnomeRecastWindow: _load_transcript_from_history completed for {transcript_item.uuid}")
+    def _post_import_ui(self, final_item: TranscriptItem):
+        """Idle callback: refreshes history, then loads and shows the imported transcript."""
+        # One main-loop dispatch for all three updates; the view may not be built
+        # yet, so it is resolved here rather than on the import thread.
+        self._refresh_history_list()
+        self.transcript_view.load_transcript(final_item)
+        self._set_active_view("transcript")
+        return GLib.SOURCE_REMOVE
 
     def _on_open_file_activate(self, action, param):
         """Handles activation of the 'open-file' action (e.g., Ctrl+O or menu)."""
-        print("Open File action activated.")
+        logger.debug("Open File action activated.")
         dialog = Gtk.FileDialog.new()
         dialog.set_title("Open Transcript or Media File")
         # dialog.set_accept_label("Open") # Already default
 
-        # Create filters
-        json_filter = Gtk.FileFilter()
-        json_filter.set_name("Transcript Files (*.json)")
-        json_filter.add_mime_type("application/json")
-        json_filter.add_pattern("*.json")
-
-        # Common audio formats (extend as needed)
-        audio_video_filter = Gtk.FileFilter()
-        audio_video_filter.set_name("Audio/Video Files")
-        # General types
-        audio_video_filter.add_mime_type("audio/*")
-        audio_video_filter.add_mime_type("video/*")
-        # Specific common patterns (examples)
-        audio_video_filter.add_pattern("*.mp3")
-        audio_video_filter.add_pattern("*.wav")
-        audio_video_filter.add_pattern("*.ogg")
-        audio_video_filter.add_pattern("*.flac")
-        audio_video_filter.add_pattern("*.mp4")
-        audio_video_filter.add_pattern("*.mkv")
-        audio_video_filter.add_pattern("*.mov")
-        audio_video_filter.add_pattern("*.webm")
-
-
-        all_supported_filter = Gtk.FileFilter()
-        all_supported_filter.set_name("All Supported Files")
-        all_supported_filter.add_filter(json_filter)
-        all_supported_filter.add_filter(audio_video_filter)
-
-
-        filters = Gio.ListStore.new(Gtk.FileFilter)
-        filters.append(all_supported_filter) # Add combined filter first
-        filters.append(json_filter)
-        filters.append(audio_video_filter)
-        
+        filters, all_supported_filter = self._get_open_filters()
         dialog.set_filters(filters)
         dialog.set_default_filter(all_supported_filter) # Default to showing all supported
 
@@ -948,34 +1309,34 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
                 file_path = file.get_path()
                 if not file_path or not os.path.isfile(file_path):
                     ToastPresenter.show(self, f"❌ Invalid file selected.")
-                    print(f"Open dialog: Invalid file path received: {file_path}")
+                    logger.warning("Open dialog: Invalid file path received: %s", file_path)
                     return
 
-                print(f"File selected for opening: {file_path}")
+                logger.debug("File selected for opening: %s", file_path)
                 
                 # Check file extension to decide action
-                if file_path.lower().endswith(".json"):
-                    print(f"Attempting to import JSON transcript: {file_path}")
+                if os.path.splitext(file_path)[1].lower() == ".json":
+                    logger.debug("Attempting to import JSON transcript: %s", file_path)
                     # This will call the import pipeline defined in Phase 4
                     self._import_transcript_file(file_path) # This method needs to be created
                 else:
                     # Assume it's an audio/video file for transcription
-                    print(f"Attempting to transcribe media file: {file_path}")
+                    logger.debug("Attempting to transcribe media file: %s", file_path)
                     self.transcript_view.reset_view() # Reset view before starting new transcription
                     self._set_active_view("transcript")
                     # The _start_transcription_process method handles its own threading for transcription
-                    self._start_transcription_process([file_path], cleanup_paths=[]) # No cleanup for user-opened files
+                    self._start_transcription_process([file_path]) # No cleanup for user-opened files
             else:
-                print("Open file operation cancelled by user.")
+                logger.debug("Open file operation cancelled by user.")
                 # No toast needed for cancellation usually
         except GLib.Error as e:
             if e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
-                print("Open file operation cancelled by user (GLib.Error).")
+                logger.debug("Open file operation cancelled by user (GLib.Error).")
             else:
-                print(f"GLib error during file open dialog: {e}")
+                logger.error("GLib error during file open dialog: %s", e)
                 ToastPresenter.show(self, f"❌ Error opening file: {e.code.value_nick}")
         except Exception as e:
-            print(f"Unexpected error during file open dialog callback: {e}")
+            logger.error("Unexpected error during file open dialog callback: %s", e, exc_info=True)
             ToastPresenter.show(self, f"❌ Unexpected error opening file.")
 
 
@@ -984,47 +1345,36 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
         Handles the import of an external JSON transcript file.
         This implements Phase 4 of the plan.
         """
-        app = self.get_application()
-        if not app or not hasattr(app, 'io_pool') or not app.io_pool:
+        if self._io_pool is None:
             ToastPresenter.show(self, "❌ Import failed: Thread pool error.")
             return
 
         def import_operation():
             try:
                 # 1. Validation (using TranscriptItem.load_from_json which now does strict validation)
-                print(f"Import operation: Validating {json_file_path}")
+                logger.debug("Import operation: Validating %s", json_file_path)
                 loaded_item = TranscriptItem.load_from_json(json_file_path)
                 
-                transcripts_dir = os.path.join(GLib.get_user_data_dir(), 'GnomeRecast', 'transcripts')
-                os.makedirs(transcripts_dir, exist_ok=True)
+                transcripts_dir = self._transcripts_dir
                 
                 original_basename = os.path.splitext(os.path.basename(json_file_path))[0]
                 new_timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
                 
-                uuid_collision = False
-                colliding_file_path = None
-                # Basic UUID collision check (can be improved for performance on many files)
-                for entry in os.scandir(transcripts_dir):
-                    if entry.is_file() and entry.name.lower().endswith(".json"):
-                        try:
-                            temp_existing_item = TranscriptItem.load_from_json(os.path.join(transcripts_dir, entry.name))
-                            if temp_existing_item.uuid == loaded_item.uuid:
-                                uuid_collision = True
-                                colliding_file_path = os.path.join(transcripts_dir, entry.name)
-                                break
-                        except Exception: # Ignore errors in existing files for this check
-                            continue
+                # UUID collision check against the persistent index; only new or
+                # changed transcripts are parsed, unreadable ones never match.
+                colliding_file_path = find_transcript_by_uuid(transcripts_dir, loaded_item.uuid)
+                uuid_collision = colliding_file_path is not None
                 
                 action_taken = "copy" # Default action
                 if uuid_collision:
                     # Simplified: default to "keep_both" to avoid complex synchronous dialog from worker thread
-                    print(f"UUID {loaded_item.uuid} collision with {colliding_file_path}. Defaulting to 'Keep Both'.")
+                    logger.info("UUID %s collision with %s. Defaulting to 'Keep Both'.", loaded_item.uuid, colliding_file_path)
                     action_taken = "keep_both"
 
                 data_to_write = loaded_item.to_dict()
 
                 if action_taken == "keep_both":
-                    data_to_write['uuid'] = str(uuid.uuid4())
+                    data_to_write['uuid'] = uuid.uuid4().hex
                     data_to_write['timestamp'] = new_timestamp_str
                     target_filename = f"{new_timestamp_str}_{original_basename}.json"
                     data_to_write['output_filename'] = target_filename
@@ -1045,32 +1395,32 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
 
                 target_path = os.path.join(transcripts_dir, target_filename)
                 atomic_write_json(data_to_write, target_path)
+                record_transcript(target_path, data_to_write['uuid'])
                 
                 ToastPresenter.show(self, f"Imported ✓ {os.path.basename(target_path)}")
-                GLib.idle_add(self.history_view.refresh_list)
-                
-                final_item_to_load = TranscriptItem.load_from_json(target_path)
-                GLib.idle_add(self.transcript_view.load_transcript, final_item_to_load)
-                GLib.idle_add(self._set_active_view, "transcript")
+
+                # data_to_write was just produced from the validated item; no need to re-read it.
+                final_item_to_load = TranscriptItem.from_dict(data_to_write, target_path, loaded_item.segments)
+                GLib.idle_add(self._post_import_ui, final_item_to_load)
 
             except Exception as e: # Catch-all for the import operation
                 if isinstance(e, ValueError):
-                    print(f"Import failed: Validation error - {e}")
+                    logger.error("Import failed: Validation error - %s", e)
                     GLib.idle_add(self._show_modal_message, "Invalid Transcript File", f"The file '{os.path.basename(json_file_path)}' is not a valid transcript file or is malformed.\n\nDetails: {e}")
                 elif isinstance(e, FileNotFoundError):
-                    print(f"Import failed: File not found - {e}")
+                    logger.error("Import failed: File not found - %s", e)
                     GLib.idle_add(self._show_modal_message, "Import Error", f"File not found: {json_file_path}")
                 elif isinstance(e, json.JSONDecodeError):
-                    print(f"Import failed: JSON decode error - {e}")
+                    logger.error("Import failed: JSON decode error - %s", e)
                     GLib.idle_add(self._show_modal_message, "Import Error", f"Could not decode JSON from: {os.path.basename(json_file_path)}")
                 else:
-                    print(f"Import failed: Unexpected error - {e}", exc_info=True)
+                    logger.error("Import failed: Unexpected error - %s", e, exc_info=True)
                     GLib.idle_add(self._show_modal_message, "Import Error", f"An unexpected error occurred while importing '{os.path.basename(json_file_path)}'.\nDetails: {str(e)[:100]}")
         # End of import_operation function definition
 
         # This call should be part of _import_transcript_file, after import_operation is defined.
         # Corrected indentation to 8 spaces (relative to class indent of 4).
-        app.io_pool.submit(import_operation)
+        self._io_pool.submit(import_operation)
 
     def _show_modal_message(self, title: str, message: str, secondary_text: Optional[str] = None, msg_type: Gtk.MessageType = Gtk.MessageType.ERROR):
         """Displays a modal Gtk.MessageDialog."""
@@ -1087,18 +1437,29 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
         dialog.present()
 
 
-    def _on_save_transcript(self, action, param):
+    def _on_save_transcript(self, action, param, force_dialog: bool = False):
         """Handles the 'activate' signal for the 'save-transcript' action."""
-        print("Save Transcript action activated (Ctrl+S).")
+        logger.debug("Save Transcript action activated (Ctrl+S).")
         # Check if transcript_view is active and has content
         if not (self.leaflet.get_visible_child_name() == "transcript" and
-                hasattr(self.transcript_view, 'has_content') and
                 self.transcript_view.has_content()):
             ToastPresenter.show(self, "Nothing to save.")
-            print("Save action: No active transcript content to save.")
+            logger.debug("Save action: No active transcript content to save.")
             return
 
-        current_transcript_data = self.transcript_view.get_transcript_data_for_saving()
+        # Segment serialization runs off the main thread; the rest continues in the callback.
+        self.transcript_view.get_transcript_data_for_saving_async(
+            functools.partial(self._on_transcript_data_ready_for_save, force_dialog=force_dialog))
+
+    def _on_save_transcript_as(self, action, param):
+        """Handles the 'save-transcript-as' action (Ctrl+Shift+S): always asks where to save."""
+        self._on_save_transcript(action, param, force_dialog=True)
+
+    def _on_transcript_data_ready_for_save(self, current_transcript_data, force_dialog: bool = False):
+        """
+        Main-loop continuation of _on_save_transcript once the save dict is built.
+        With force_dialog, the transcript is saved as a new file chosen in the Save As dialog.
+        """
         if not current_transcript_data:
             ToastPresenter.show(self, "Could not retrieve transcript data to save.")
             return
@@ -1115,9 +1476,10 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
         
         target_item_for_save = self.transcript_view.get_current_item() # Needs implementation in TranscriptView
 
-        if target_item_for_save and target_item_for_save.source_path and os.path.exists(target_item_for_save.source_path):
+        if (not force_dialog and target_item_for_save and target_item_for_save.source_path
+                and os.path.exists(target_item_for_save.source_path)):
             # Overwrite existing file
-            print(f"Attempting to overwrite existing transcript: {target_item_for_save.source_path}")
+            logger.debug("Attempting to overwrite existing transcript: %s", target_item_for_save.source_path)
             try:
                 # Update the target_item_for_save with data from current_transcript_data if necessary,
                 # then call target_item_for_save.save() or directly use atomic_write_json.
@@ -1137,12 +1499,10 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
                 # This might involve merging view data with existing item data if it's an overwrite.
                 
                 # Simplest path for now: assume current_transcript_data IS the complete data to save.
-                # This requires transcript_view.get_transcript_data_for_saving() to be comprehensive.
+                # This requires transcript_view.snapshot_transcript_data_for_saving() to be comprehensive.
                 
-                # Get the application's I/O pool
-                app = self.get_application()
-                if not app or not hasattr(app, 'io_pool') or not app.io_pool:
-                    print("Error: I/O thread pool not available on application object.")
+                if self._io_pool is None:
+                    logger.error("Error: I/O thread pool not available on application object.")
                     ToastPresenter.show(self, "❌ Save failed: Thread pool error.")
                     return
 
@@ -1150,59 +1510,63 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
                     try:
                         # Ensure all required fields are in current_transcript_data
                         # This is crucial for meeting the spec.
-                        # Example: ensure 'language', 'source_path' (media), 'audio_source_path' (media) are there.
+                        # Example: ensure 'language' and 'source_path' (media) are there.
                         # If current_transcript_data doesn't have them, fetch from target_item_for_save.
                         data_to_save = {
                             "uuid": target_item_for_save.uuid,
-                            "timestamp": datetime.strptime(target_item_for_save.timestamp, "%Y-%m-%d %H:%M:%S").strftime("%Y%m%d_%H%M%S"), # Convert to JSON format
+                            "timestamp": _compact_ts(target_item_for_save.timestamp), # Convert to JSON format
                             "text": current_transcript_data.get("text", target_item_for_save.transcript_text),
-                            "segments": current_transcript_data.get("segments", target_item_for_save.to_segment_dicts()),
+                            # The fallback is only built when the view data lacks segments.
+                            "segments": current_transcript_data["segments"] if "segments" in current_transcript_data else target_item_for_save.to_segment_dicts(),
                             "language": current_transcript_data.get("language", target_item_for_save.language),
                             "source_path": target_item_for_save.audio_source_path, # Media path
-                            "audio_source_path": target_item_for_save.audio_source_path, # Media path
                             "output_filename": target_item_for_save.output_filename
                         }
 
-                        atomic_write_json(data_to_save, target_item_for_save.source_path)
-                        ToastPresenter.show(self, f"Saved ✓ {os.path.basename(target_item_for_save.source_path)}")
-                        GLib.idle_add(self.history_view.refresh_list) # Refresh history as content changed
+                        data = GLib.Bytes.new(dump_json_bytes(data_to_save))
+                        saved_item = TranscriptItem.from_dict(data_to_save, target_item_for_save.source_path)
+                        GLib.idle_add(self._write_save_async, target_item_for_save.source_path, data, saved_item, target_item_for_save)
                     except Exception as e:
-                        print(f"Error saving (overwrite) to {target_item_for_save.source_path}: {e}")
+                        logger.error("Error saving (overwrite) to %s: %s", target_item_for_save.source_path, e)
                         ToastPresenter.show(self, f"❌ Could not save {os.path.basename(target_item_for_save.source_path)}: {e}")
 
-                app.io_pool.submit(save_operation)
+                self._io_pool.submit(save_operation)
 
             except Exception as e: # Catch errors before submitting to thread pool
-                print(f"Error preparing to save (overwrite) {target_item_for_save.source_path}: {e}")
+                logger.error("Error preparing to save (overwrite) %s: %s", target_item_for_save.source_path, e)
                 ToastPresenter.show(self, f"❌ Save error: {e}")
 
         else:
-            # New, unsaved session: Prompt with Gtk.FileDialog.save()
-            print("New transcript session. Prompting for save location.")
-            dialog = Gtk.FileDialog.new()
-            dialog.set_title("Save Transcript As...")
-            
-            # Default directory and filename
-            default_folder_path = os.path.join(GLib.get_user_data_dir(), 'GnomeRecast', 'transcripts')
-            os.makedirs(default_folder_path, exist_ok=True)
-            default_folder = Gio.File.new_for_path(default_folder_path)
-            dialog.set_initial_folder(default_folder)
-            
             default_filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_new.json"
-            dialog.set_initial_name(default_filename)
 
-            # File filter for JSON
-            json_filter = Gtk.FileFilter()
-            json_filter.set_name("JSON Transcript Files (*.json)")
-            json_filter.add_mime_type("application/json")
-            json_filter.add_pattern("*.json")
-            
-            filters = Gio.ListStore.new(Gtk.FileFilter)
-            filters.append(json_filter)
-            dialog.set_filters(filters)
-            dialog.set_default_filter(json_filter)
+            # Quick Save: new transcripts go straight to the default folder and name;
+            # the dialog is only needed if that file already exists or Save As was used.
+            # The existence check runs with the save on the I/O pool.
+            if not force_dialog and self.settings.get_boolean("quick-save-new-transcripts"):
+                target_path = os.path.join(self._transcripts_dir, default_filename)
+                logger.debug("New transcript session. Quick-saving to %s", target_path)
+                self._save_new_transcript(target_path, current_transcript_data, quick_save=True)
+                return
 
-            dialog.save(self, None, self._on_new_transcript_file_selected_for_save, current_transcript_data)
+            self._prompt_save_new_transcript(default_filename, current_transcript_data)
+
+    def _prompt_save_new_transcript(self, default_filename: str, transcript_data_to_save: dict):
+        """Asks for a location with Gtk.FileDialog.save() and saves a new transcript there."""
+        # New, unsaved session: Prompt with Gtk.FileDialog.save()
+        logger.debug("New transcript session. Prompting for save location.")
+        dialog = Gtk.FileDialog.new()
+        dialog.set_title("Save Transcript As...")
+
+        # Default directory and filename
+        dialog.set_initial_folder(self._default_save_folder)
+        dialog.set_initial_name(default_filename)
+
+        filters, json_filter = self._get_save_filters()
+        dialog.set_filters(filters)
+        dialog.set_default_filter(json_filter)
+
+        dialog.save(self, None, self._on_new_transcript_file_selected_for_save, transcript_data_to_save)
+        return GLib.SOURCE_REMOVE
 
     def _on_new_transcript_file_selected_for_save(self, dialog, result, transcript_data_to_save):
         """Callback for Gtk.FileDialog.save() for new transcripts."""
@@ -1210,128 +1574,149 @@ class GnomeRecastWindow(Adw.ApplicationWindow):
             file = dialog.save_finish(result)
             if file:
                 target_path = file.get_path()
-                print(f"New transcript save path selected: {target_path}")
-
-                # Ensure the data to save has all required fields from spec §1.1
-                # This is a new save, so some fields need to be generated.
-                final_data_to_save = {
-                    "uuid": str(uuid.uuid4()), # New UUID
-                    "timestamp": datetime.now().strftime("%Y%m%d_%H%M%S"), # New timestamp
-                    "text": transcript_data_to_save.get("text", ""),
-                    "segments": transcript_data_to_save.get("segments", []),
-                    "language": transcript_data_to_save.get("language", self.settings.get_string("target-language") if not self.settings.get_boolean("auto-detect-language") else "en"), # Best guess for language
-                    "source_path": "",  # No original media source for a brand new, unsaved transcript unless explicitly set
-                    "audio_source_path": "", # ditto
-                    "output_filename": os.path.basename(target_path)
-                }
-                
-                app = self.get_application()
-                if not app or not hasattr(app, 'io_pool') or not app.io_pool:
-                    print("Error: I/O thread pool not available on application object.")
-                    ToastPresenter.show(self, "❌ Save failed: Thread pool error.")
-                    return
+                logger.debug("New transcript save path selected: %s", target_path)
 
-                def save_operation():
-                    try:
-                        atomic_write_json(final_data_to_save, target_path)
-                        ToastPresenter.show(self, f"Saved ✓ {os.path.basename(target_path)}")
-                        GLib.idle_add(self.history_view.refresh_list)
-                        # After a successful new save, update the transcript_view's current item
-                        # This requires TranscriptItem to be created and loaded back or updated in view
-                        # For now, this part is deferred until TranscriptView has better state management.
-                        # Ideally:
-                        # new_item = TranscriptItem.load_from_json(target_path)
-                        # if new_item:
-                        # GLib.idle_add(self.transcript_view.set_current_item, new_item) # Method to be created
-                    except Exception as e:
-                        print(f"Error saving new transcript to {target_path}: {e}")
-                        ToastPresenter.show(self, f"❌ Could not save {os.path.basename(target_path)}: {e}")
-                
-                app.io_pool.submit(save_operation)
+                self._save_new_transcript(target_path, transcript_data_to_save)
 
             else:
-                print("Save operation cancelled by user.")
+                logger.debug("Save operation cancelled by user.")
                 ToastPresenter.show(self, "Save cancelled.")
         except GLib.Error as e:
             if e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
-                 print("File save operation cancelled by user (GLib.Error).")
+                 logger.debug("File save operation cancelled by user (GLib.Error).")
                  ToastPresenter.show(self, "Save cancelled.")
             else:
-                 print(f"GLib error during file save dialog: {e}")
+                 logger.error("GLib error during file save dialog: %s", e)
                  ToastPresenter.show(self, f"❌ Save error: {e}")
         except Exception as e:
-            print(f"Unexpected error during file save dialog callback: {e}")
+            logger.error("Unexpected error during file save dialog callback: %s", e, exc_info=True)
             ToastPresenter.show(self, f"❌ Unexpected save error: {e}")
 
 
+    def _save_new_transcript(self, target_path: str, transcript_data_to_save: dict, quick_save: bool = False):
+        """
+        Saves view data as a new transcript (fresh UUID and timestamp) to target_path.
+        With quick_save, an existing file at target_path is left alone and the
+        Save As dialog is shown instead.
+        """
+        # Ensure the data to save has all required fields from spec §1.1
+        # This is a new save, so some fields need to be generated; the view data
+        # (text, segments and possibly language) is merged in over the defaults.
+        final_data_to_save = {
+            "text": "",
+            "segments": [],
+            # Best guess for language, from the cached settings mirrors
+            "language": "en" if self._cached_autodetect else self._cached_lang,
+            **transcript_data_to_save,
+            "uuid": uuid.uuid4().hex, # New UUID
+            "timestamp": datetime.now().strftime("%Y%m%d_%H%M%S"), # New timestamp
+            "source_path": "",  # No original media source for a brand new, unsaved transcript unless explicitly set
+            "output_filename": os.path.basename(target_path)
+        }
+        
+        if self._io_pool is None:
+            logger.error("Error: I/O thread pool not available on application object.")
+            ToastPresenter.show(self, "❌ Save failed: Thread pool error.")
+            return
+        
+        def save_operation():
+            try:
+                if quick_save and os.path.exists(target_path):
+                    GLib.idle_add(self._prompt_save_new_transcript, os.path.basename(target_path), transcript_data_to_save)
+                    return
+                data = GLib.Bytes.new(dump_json_bytes(final_data_to_save))
+                saved_item = TranscriptItem.from_dict(final_data_to_save, target_path)
+                # Once written, saved_item replaces the view's (absent) current item,
+                # so the next save overwrites this file instead of creating another.
+                GLib.idle_add(self._write_save_async, target_path, data, saved_item, None)
+            except Exception as e:
+                logger.error("Error saving new transcript to %s: %s", target_path, e)
+                ToastPresenter.show(self, f"❌ Could not save {os.path.basename(target_path)}: {e}")
+        
+        self._io_pool.submit(save_operation)
+
+    def _write_save_async(self, target_path: str, data: GLib.Bytes, saved_item: TranscriptItem,
+                          view_item: Optional[TranscriptItem]):
+        """
+        Queues serialized transcript JSON to replace target_path; saved_item is the
+        same transcript, built on the pool thread for the history list and the view.
+        view_item is the view's current item when the save started (None for a new
+        transcript). Runs on the main loop; the pool thread that serialized data is
+        already free.
+        """
+        if self._save_queue is None:
+            logger.error("Error: Save queue not available on application object.")
+            ToastPresenter.show(self, "❌ Save failed: Save queue error.")
+            return GLib.SOURCE_REMOVE
+        self._save_queue.enqueue(target_path, data,
+                                 functools.partial(self._on_save_written, saved_item=saved_item, view_item=view_item))
+        return GLib.SOURCE_REMOVE
+
+    def _on_save_written(self, target_path: str, error_message: Optional[str], saved_item: TranscriptItem,
+                         view_item: Optional[TranscriptItem]):
+        """Completion callback for _write_save_async; runs on the main loop."""
+        if error_message is not None:
+            logger.error("Error saving transcript to %s: %s", target_path, error_message)
+            ToastPresenter.show(self, f"❌ Could not save {os.path.basename(target_path)}: {error_message}")
+            return
+        # A burst of saves (e.g. Quick Save in quick succession) gets a single toast.
+        ToastPresenter.show_coalesced(self, "saved", f"Saved ✓ {os.path.basename(target_path)}", "Saved ✓ {0} transcripts")
+        # The view now shows the saved file, unless it moved on to another transcript meanwhile.
+        # Two quick saves within the same second share a path; the later write wins.
+        current_item = self.transcript_view.get_current_item()
+        if self.transcript_view.has_content() and (
+                current_item is view_item or (current_item is not None and current_item.source_path == target_path)):
+            self.transcript_view.set_current_item(saved_item)
+        # Only this transcript changed: patch its history row instead of rescanning the directory.
+        self._reader_text_uuid = None
+        if self._history_view is not None:
+            self._history_view.update_item(target_path, saved_item)
+
     def _on_reader_button_clicked(self, button):
         """Handles the click event for the Reader button."""
-        print("Reader button clicked.")
+        logger.debug("Reader button clicked.")
         if not self._selected_history_transcript:
-            print("Error: Reader button clicked but no history item selected.")
+            logger.error("Error: Reader button clicked but no history item selected.")
             return
 
-        full_text_parts = []
-        if self._selected_history_transcript.segments:
-            for segment in self._selected_history_transcript.segments:
-                    # isinstance check removed as TranscriptItem.load_from_json ensures SegmentItem instances
-                    start_m, start_s = divmod(int(segment.start), 60)
-                    end_m, end_s = divmod(int(segment.end), 60)
-                    timestamp = f"[{start_m:02d}:{start_s:02d} → {end_m:02d}:{end_s:02d}]"
-                    full_text_parts.append(f"{timestamp}\n{segment.text}\n")
-        full_text = "".join(full_text_parts)
-
-        if not full_text:
-            print("Warning: Selected history item generated no text for Reader mode.")
+        if self._reader_window is None:
+            self._build_reader_window()
+        item_uuid = self._selected_history_transcript.uuid
+        if item_uuid == self._reader_text_uuid:
+            # Same item as last time: the buffer already holds its text.
+            self._reader_window.present()
+            return
+        buffer = self._reader_buffer
+
+        # Reader shows one segment per line. The stored full text is only used as is
+        # when it already has line breaks; usually it is the segments joined on one line.
+        full_text = self._selected_history_transcript.transcript_text
+        if full_text and "→" in full_text:
+            full_text = _TS_LINE_RE.sub("", full_text)
+        full_text = full_text.strip() if full_text else ""
+        inserted = 0
+        if "\n" not in full_text:
+            # Build it from the segments, which were filtered to SegmentItems once at
+            # selection time. Each segment is inserted straight into the buffer
+            # instead of joining one large string.
+            buffer.begin_user_action()
+            buffer.set_text("")
+            for text in self._iter_reader_lines(self._selected_history_segments):
+                buffer.insert(buffer.get_end_iter(), f"\n{text}" if inserted else text)
+                inserted += 1
+            buffer.end_user_action()
+        if not inserted and full_text:
+            # Multi-line stored text, or no usable segments: show the stored text.
+            buffer.set_text(full_text)
+            inserted = 1
+
+        if not inserted:
+            self._reader_text_uuid = None
+            logger.warning("Warning: Selected history item generated no text for Reader mode.")
             return
 
-        cleaned_text = re.sub(r"^\[\d{2}:\d{2}\s*→\s*\d{2}:\d{2}\]\n?", "", full_text, flags=re.MULTILINE)
-        cleaned_text = cleaned_text.strip()
-
-        reader_window = Adw.ApplicationWindow(application=self.get_application())
-        reader_window.set_title("Reader Mode - Transcript")
-        reader_window.set_resizable(True)
-        reader_window.set_default_size(400, 600)
-        reader_window.set_modal(True)
-        reader_window.add_css_class("reader-popup-window")
-
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        main_box.set_margin_top(6)
-        main_box.set_margin_end(6)
-        main_box.set_margin_start(6)
-        main_box.set_margin_bottom(6)
-
-        top_bar_overlay = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        top_bar_overlay.add_css_class("topbar")
-        top_bar_overlay.set_valign(Gtk.Align.START)
-        top_bar_overlay.set_halign(Gtk.Align.END)
-        top_bar_overlay.set_margin_top(12)
-        top_bar_overlay.set_margin_end(12)
-
-        close_button = Gtk.Button(label="✕")
-        close_button.connect("clicked", lambda btn: reader_window.close())
-        top_bar_overlay.append(close_button)
-
-        buffer = Gtk.TextBuffer()
-        buffer.set_text(cleaned_text)
-
-        text_view = Gtk.TextView(buffer=buffer)
-        text_view.add_css_class("reader-text-view")
-        text_view.set_editable(False)
-        text_view.set_wrap_mode(Gtk.WrapMode.WORD)
-
-        scroller = Gtk.ScrolledWindow()
-        scroller.add_css_class("reader-scrolled-window")
-        scroller.set_child(text_view)
-        scroller.set_vexpand(True)
-        scroller.set_hexpand(True)
-
-        overlay = Gtk.Overlay()
-        overlay.set_child(scroller)
-        overlay.add_overlay(top_bar_overlay)
-
-        reader_window.set_content(overlay)
-        reader_window.present()
+        self._reader_text_uuid = item_uuid
+        self._reader_window.present()
 
-        print("Reader mode window displayed.")
+        logger.debug("Reader mode window displayed.")
 
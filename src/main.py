@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import logging
 import sys
 import gi
 
@@ -11,6 +12,8 @@ from gi.repository import Gtk, Adw, Gst
 from gnomerecast.application import GnomeRecastApplication
 
 if __name__ == "__main__":
+    # DEBUG messages are filtered before their arguments are formatted.
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(name)s: %(message)s")
     Gst.init(None)
     app = GnomeRecastApplication()
     exit_status = app.run(sys.argv)